@@ -0,0 +1,310 @@
+"""
+Local control and telemetry API on asyncio (standard library only).
+
+    GET  /status   running flag + latest telemetry snapshot
+    GET  /metrics  latest telemetry snapshot
+    GET  /config   current config values
+    POST /config   JSON object of config keys to update
+    POST /start    start the controller
+    POST /stop     stop the controller
+    GET  /ws       WebSocket: pushes telemetry snapshots as JSON text frames;
+                   accepts {"action": "start"|"stop"|"config", "config": {...}}
+
+Requests carrying an Origin header from anything but a local page are
+rejected (403), WebSocket upgrades included, and POSTs must be
+`Content-Type: application/json` (415). A web page on another site can
+therefore neither open the socket nor send a simple cross-site form POST.
+
+The server runs its own event loop on a daemon thread. Telemetry comes from
+utils.telemetry snapshots, so serving a request never takes a lock the frame
+loop uses.
+"""
+import json
+import base64
+import asyncio
+import hashlib
+import struct
+import threading
+from urllib.parse import urlsplit
+
+import control
+from config import Config
+from utils.telemetry import telemetry
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_BODY = 64 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 415: "Unsupported Media Type"}
+
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+
+def is_local_origin(origin):
+    """True if there is no Origin header (non-browser client) or it names a page on this machine."""
+    if origin is None:
+        return True
+    try:
+        parts = urlsplit(origin)
+        return parts.scheme in ("http", "https") and parts.hostname in LOCAL_HOSTS
+    except ValueError:
+        return False
+
+
+class ControlServer:
+    """
+    Minimal HTTP/1.1 + WebSocket server. start() returns once the socket is
+    bound; stop() shuts the loop down from any thread.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, push_interval: float = 0.1):
+        self.host = host
+        self.port = port
+        self.push_interval = push_interval
+        self.loop = None
+        self.thread = None
+        self._server = None
+        self._ready = threading.Event()
+        self._error = None
+
+    def start(self):
+        if self.thread is not None:
+            return self
+        self.thread = threading.Thread(target=self._run, name="control-api", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self.thread = None
+            raise self._error
+        print(f"Control API listening on http://{self.host}:{self.port}")
+        return self
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self._server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port))
+            # Port 0 picks a free port; report the real one
+            self.port = self._server.sockets[0].getsockname()[1]
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            self.loop.close()
+            return
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self._server.close()
+            # Cancel open connections and telemetry pushers and let their cleanup run
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.run_until_complete(self._server.wait_closed())
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def stop(self):
+        if self.loop is not None and self.thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=2.0)
+            self.thread = None
+
+    def join(self):
+        if self.thread is not None:
+            self.thread.join()
+
+    # --- HTTP -------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ", 2)
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    k, v = line.split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+            length = int(headers.get("content-length", 0) or 0)
+            if length > MAX_BODY:
+                await self._respond(writer, 413, {"error": "body too large"})
+                return
+            body = await reader.readexactly(length) if length else b""
+
+            path = path.split("?", 1)[0]
+            if not is_local_origin(headers.get("origin")):
+                await self._respond(writer, 403, {"error": "cross-origin requests are not allowed"})
+                return
+            if method == "POST" and headers.get("content-type", "").split(";", 1)[0].strip().lower() != "application/json":
+                await self._respond(writer, 415, {"error": "POST requires Content-Type: application/json"})
+                return
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._websocket(reader, writer, headers)
+                return
+            status, payload = await self._dispatch(method, path, body)
+            await self._respond(writer, status, payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutting down: finish normally so the stream callback sees no exception
+            pass
+        except Exception as e:
+            try:
+                await self._respond(writer, 400, {"error": str(e)})
+            except Exception:
+                pass
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _respond(self, writer, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data)
+        await writer.drain()
+
+    async def _dispatch(self, method, path, body):
+        """Route one request; returns (status, json-serializable payload)."""
+        if path == "/status" and method == "GET":
+            return 200, {"running": control.is_running(), "telemetry": dict(telemetry.read())}
+        if path == "/metrics" and method == "GET":
+            return 200, dict(telemetry.read())
+        if path == "/config":
+            if method == "GET":
+                return 200, control.config_snapshot()
+            if method == "POST":
+                cfg = json.loads(body or b"{}")
+                if not isinstance(cfg, dict):
+                    return 400, {"error": "expected a JSON object"}
+                # apply_config writes config.json; keep file IO off the event loop
+                applied = await self.loop.run_in_executor(None, control.apply_config, cfg)
+                return 200, {"applied": applied}
+        if path == "/start" and method == "POST":
+            return 200, {"message": control.start_controller()}
+        if path == "/stop" and method == "POST":
+            return 200, {"message": control.stop_controller()}
+        if path in ("/status", "/metrics", "/config", "/start", "/stop"):
+            return 405, {"error": f"{method} not allowed on {path}"}
+        return 404, {"error": f"no route for {path}"}
+
+    # --- WebSocket --------------------------------------------------------
+
+    async def _websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, 400, {"error": "missing Sec-WebSocket-Key"})
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+
+        pusher = asyncio.ensure_future(self._push_telemetry(writer))
+        try:
+            while True:
+                opcode, payload = await _read_frame(reader)
+                if opcode == 0x8:  # close
+                    writer.write(_frame(0x8, payload[:2]))
+                    await writer.drain()
+                    break
+                if opcode == 0x9:  # ping
+                    writer.write(_frame(0xA, payload))
+                    await writer.drain()
+                elif opcode == 0x1:
+                    reply = await self._ws_command(payload)
+                    writer.write(_frame(0x1, json.dumps(reply).encode("utf-8")))
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            pusher.cancel()
+
+    async def _ws_command(self, payload):
+        try:
+            msg = json.loads(payload.decode("utf-8"))
+            action = msg.get("action")
+            if action == "start":
+                return {"message": control.start_controller()}
+            if action == "stop":
+                return {"message": control.stop_controller()}
+            if action == "config":
+                applied = await self.loop.run_in_executor(None, control.apply_config, msg.get("config") or {})
+                return {"applied": applied}
+            return {"error": f"unknown action: {action}"}
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _push_telemetry(self, writer):
+        """Send each new snapshot at most once per push_interval."""
+        last_seq = None
+        try:
+            while True:
+                snapshot = telemetry.read()
+                if snapshot.get("seq") != last_seq:
+                    last_seq = snapshot.get("seq")
+                    data = dict(snapshot)
+                    data["running"] = bool(Config.running)
+                    writer.write(_frame(0x1, json.dumps(data).encode("utf-8")))
+                    await writer.drain()
+                await asyncio.sleep(self.push_interval)
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+
+
+def _frame(opcode, payload):
+    """Encode an unmasked server-to-client frame."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+async def _read_frame(reader):
+    """Read one client frame and return (opcode, unmasked payload). Fragmented messages are not supported."""
+    b0, b1 = await reader.readexactly(2)
+    opcode = b0 & 0x0F
+    length = b1 & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_BODY:
+        raise ConnectionError("WebSocket frame too large")
+    mask = await reader.readexactly(4) if b1 & 0x80 else None
+    payload = await reader.readexactly(length) if length else b""
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Local control and telemetry API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=getattr(Config, 'API_PORT', 8765))
+    args = parser.parse_args()
+    server = ControlServer(args.host, args.port).start()
+    try:
+        server.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
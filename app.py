@@ -15,11 +15,17 @@ except ImportError:
     pass
 
 import cv2
-import mediapipe as mp
 import time
 from controller import Controller, Config , initialize_controller
 from utils.fps_meter import FPSMeter
 from video.capture_manager import CaptureManager
+from utils.perf_governor import PerformanceGovernor
+from detection.hand_detector import create_detector, draw_hands, assign_hands
+from utils.telemetry import telemetry
+from events.event_bus import EventPublisher, Hand, DEFAULT_PATH as EVENT_BUS_DEFAULT_PATH
+
+# The running HandTrackingApp, if any (read by the UI for governor status)
+active_app = None
 
 def reload_config():
     """
@@ -35,19 +41,34 @@ def reload_config():
 class HandTrackingApp:
     def __init__(self):
         """
-        Initialize the Hand Tracking Application, setting up camera, Mediapipe hands module,
-        and other necessary parameters. Print control instructions for the user.
+        Initialize the Hand Tracking Application, setting up camera, the landmark detector
+        backend selected by DETECTOR_BACKEND, and other necessary parameters. Print control instructions for the user.
         """
-        self.capture = CaptureManager(device_index=0, width=640, height=480, target_fps=Config.TARGET_FPS)
+        self.governor = PerformanceGovernor(target_latency_ms=Config.TARGET_LATENCY_MS,
+                                            max_fps=Config.TARGET_FPS)
+        self.governor_enabled = bool(getattr(Config, 'GOVERNOR_ENABLED', False))
+        level = self.governor.current
+        self.capture = CaptureManager(device_index=0, width=level.width, height=level.height,
+                                      target_fps=self.effective_target_fps())
         
-        self.mpHands = mp.solutions.hands # type: ignore
-        self.hands = self.mpHands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+        self.detector = create_detector(
+            getattr(Config, 'DETECTOR_BACKEND', 'solutions'),
+            model_complexity=level.model_complexity,
+            model_path=getattr(Config, 'HAND_LANDMARKER_MODEL', None) or None,
         )
-        self.mpDraw = mp.solutions.drawing_utils # type: ignore
+        if not self.detector.supports_model_complexity:
+            # Levels that differ only in complexity would be no-op decisions for this backend
+            self.governor.set_fixed_complexity(getattr(self.detector, 'model_complexity', level.model_complexity))
+        self._start_time = time.monotonic()
+        self.last_hands = ()
+        
+        if getattr(Config, 'EVENT_BUS_ENABLED', False):
+            path = getattr(Config, 'EVENT_BUS_PATH', '') or EVENT_BUS_DEFAULT_PATH
+            try:
+                Controller.event_bus = EventPublisher(path)
+                print(f"Publishing gesture events on {path}")
+            except OSError as e:
+                print(f"Gesture event bus disabled: {e}")
         
         self.fps_meter = FPSMeter(window=30, ema_alpha=0.9)
         self.fps_display = 0
@@ -62,9 +83,41 @@ class HandTrackingApp:
     print("- Move ring/little finger midpoint to move cursor")
     print("- LEFT hand: index+thumb = hold LEFT click; middle+thumb = RIGHT click")
     print("- All fingers up + thumb down = FREEZE cursor")
+    print("- RIGHT hand: index+middle up, move up/down = SCROLL")
+    print("- LEFT hand: middle+ring folded, little up, spread/close thumb+index = ZOOM in/out")
     print("- ESC key to exit")
     print("Adjust parameters in the Gradio UI for real-time tuning.")
         
+    def effective_target_fps(self):
+        """TARGET_FPS from config acts as a ceiling; the governor may pace lower."""
+        if getattr(Config, 'GOVERNOR_ENABLED', False):
+            return min(Config.TARGET_FPS, self.governor.current.fps)
+        return Config.TARGET_FPS
+
+    def sync_governor(self):
+        """
+        Follow runtime config changes: keep the FPS ceiling in step with TARGET_FPS
+        and put capture size and model back to the default level when the
+        governor is switched off.
+        """
+        self.governor.set_max_fps(Config.TARGET_FPS)
+        enabled = bool(getattr(Config, 'GOVERNOR_ENABLED', False))
+        if enabled != self.governor_enabled:
+            self.governor_enabled = enabled
+            if not enabled and self.governor.reset("governor disabled") is not None:
+                self.apply_governor_level()
+
+    def apply_governor_level(self):
+        """
+        Push the governor's current level to the capture device; the detector
+        rebuilds its model only when the model complexity actually changed.
+        """
+        level = self.governor.current
+        self.capture.set_resolution(level.width, level.height)
+        self.capture.set_target_fps(self.effective_target_fps())
+        if self.detector.set_model_complexity(level.model_complexity):
+            print(f"Rebuilt {self.detector.name} detector with model_complexity={level.model_complexity}")
+
     def calculate_fps(self):
         """Update and return smoothed FPS using FPSMeter."""
         self.fps_display = self.fps_meter.get_int()
@@ -94,112 +147,80 @@ class HandTrackingApp:
             cv2.putText(img, cursor_status, (10, 90), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, cursor_color, 2)
         
+        if getattr(Config, 'GOVERNOR_ENABLED', False):
+            cv2.putText(img, f"Gov: {self.governor.summary()}", (10, height - 35),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 200, 0), 1)
+            if self.governor.decisions:
+                last = self.governor.decisions[-1]
+                cv2.putText(img, f"Last: L{last.old_level}->L{last.new_level}", (10, height - 15),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 200, 0), 1)
+        
         cv2.putText(img, "ESC: Exit", (width - 100, height - 10), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
     
-    def process_hand_landmarks(self, results, img):
+    def publish_telemetry(self, stage_times):
+        """Publish a read-only snapshot of this frame's metrics for the control API."""
+        last = self.governor.decisions[-1].describe() if self.governor.decisions else None
+        bus = Controller.event_bus
+        telemetry.publish({
+            "fps": self.fps_display,
+            "hand_detected": self.hand_detected,
+            "cursor_frozen": bool(self.hand_detected and Controller.all_fingers_up and Controller.thumb_finger_down),
+            "detector": self.detector.name,
+            "stage_ms": {k: round(v * 1000.0, 2) for k, v in stage_times.items()},
+            "governor": {
+                "enabled": bool(getattr(Config, 'GOVERNOR_ENABLED', False)),
+                "level": self.governor.level,
+                "setting": self.governor.current.describe(),
+                "latency_ms": round(self.governor.latency_ms, 2),
+                "target_latency_ms": self.governor.target_latency_ms,
+                "cpu": round(self.governor.cpu, 3),
+                "last_decision": last,
+            },
+            "event_bus": None if bus is None else {
+                "subscribers": len(bus.subscribers),
+                "sent": bus.sent,
+                "dropped": bus.dropped,
+            },
+        })
+
+    def process_hand_landmarks(self, result, img):
         """
         Process the hand landmarks detected in the current frame, updating the controller
         state and drawing the landmarks and connections on the image. This method also
         handles the detection of various hand gestures and updates the cursor movement
         accordingly.
         """
-        if results.multi_hand_landmarks:
+        if result.hands:
             self.hand_detected = True
             self.frames_without_hand = 0
 
-            hands = results.multi_hand_landmarks
-            handedness_list = getattr(results, 'multi_handedness', None)
-            left_hand = None
-            right_hand = None
-            if handedness_list:
-                for i, lm in enumerate(hands):
-                    try:
-                        label = handedness_list[i].classification[0].label  # 'Left' or 'Right'
-                        # We flipped the image horizontally, invert labels to match user's perspective
-                        if label == 'Left':
-                            label = 'Right'
-                        elif label == 'Right':
-                            label = 'Left'
-                    except Exception:
-                        label = None
-                    if label == 'Right' and right_hand is None:
-                        right_hand = lm
-                    elif label == 'Left' and left_hand is None:
-                        left_hand = lm
-            else:
-                # Fallback heuristic based on x position after flip (rightmost = right hand)
-                if len(hands) == 1:
-                    right_hand = hands[0]
-                elif len(hands) >= 2:
-                    x0 = hands[0].landmark[0].x
-                    x1 = hands[1].landmark[0].x
-                    if x0 >= x1:
-                        right_hand, left_hand = hands[0], hands[1]
-                    else:
-                        right_hand, left_hand = hands[1], hands[0]
-
-            # Optionally invert roles based on config
-            if getattr(Config, 'INVERT_HANDS', False):
-                right_hand, left_hand = left_hand, right_hand
+            hands = result.hands
+            right_hand, left_hand = assign_hands(hands, getattr(Config, 'INVERT_HANDS', False))
 
             # Draw landmarks for all hands
-            for lm in hands:
-                self.mpDraw.draw_landmarks(
-                    img,
-                    lm,
-                    self.mpHands.HAND_CONNECTIONS,
-                    landmark_drawing_spec=self.mpDraw.DrawingSpec(
-                        color=(0, 0, 255), thickness=2, circle_radius=2
-                    ),
-                    connection_drawing_spec=self.mpDraw.DrawingSpec(
-                        color=(0, 255, 0), thickness=2
-                    )
-                )
+            draw_hands(img, hands)
             
-            try:
-                # Movement with right hand
+            bus = Controller.event_bus
+            if bus is not None and getattr(Config, 'EVENT_BUS_LANDMARKS', False):
                 if right_hand is not None:
-                    Controller.hand_Landmarks = right_hand
-                    Controller.update_fingers_status()
-                    Controller.cursor_moving()
-                # Clicks with left hand
+                    bus.publish_landmarks(right_hand, Hand.RIGHT)
                 if left_hand is not None:
-                    Controller.hand_Landmarks = left_hand
-                    Controller.update_fingers_status()
-                    # Left click hold: index+thumb
-                    Controller.handle_left_click_hold(bool(Controller.index_finger_within_thumb_finger))
-                    # Right click single: middle+thumb
-                    Controller.handle_right_click(bool(Controller.middle_finger_within_thumb_finger))
-                else:
-                    # No left hand -> ensure click states are reset
-                    if hasattr(Controller, 'release_left_hold'):
-                        Controller.release_left_hold()
-                # Restore right hand as default context
-                if right_hand is not None:
-                    Controller.hand_Landmarks = right_hand
-                
-                # if hasattr(Controller, 'detect_scrolling'):
-                #     Controller.detect_scrolling()
-                # if hasattr(Controller, 'detect_zoomming'):
-                #     Controller.detect_zoomming()
-                # if hasattr(Controller, 'detect_clicking'):
-                #     Controller.detect_clicking()
-                # if hasattr(Controller, 'detect_dragging'):
-                #     Controller.detect_dragging()
-                    
+                    bus.publish_landmarks(left_hand, Hand.LEFT)
+            
+            motion_gestures = getattr(Config, 'MOTION_GESTURES', False)
+            # Frame timestamp (seconds) for velocity/trend; async results lag the wall clock
+            timestamp = result.timestamp_ms / 1000.0
+            try:
+                # Movement (and scroll) with the right hand, clicks (and zoom) with the left
+                Controller.process_hands(right_hand, left_hand, timestamp, motion_gestures)
             except Exception as e:
                 print(f"Error in controller methods: {e}")
         else:
             self.frames_without_hand += 1
             if self.frames_without_hand >= self.max_frames_without_hand:
                 self.hand_detected = False
-                Controller.hand_Landmarks = None
-                if hasattr(Controller, 'reset_smoothing'):
-                    Controller.reset_smoothing()
-                if hasattr(Controller, 'release_left_hold'):
-                    Controller.release_left_hold()
-                # No right-hold; right click is stateless single click
+                Controller.hand_lost()
     
     def run(self):
         """
@@ -207,26 +228,54 @@ class HandTrackingApp:
         """
         try:
             while Config.running:
-                # keep capture target fps in sync with config
-                self.capture.set_target_fps(Config.TARGET_FPS)
+                # keep capture target fps and governor state in sync with config
+                self.sync_governor()
+                self.capture.set_target_fps(self.effective_target_fps())
                 success, img = self.capture.read()
                 
                 if not success:
                     print("Error: Failed to read from camera")
                     break
                 
+                t0 = time.perf_counter()
                 img = cv2.flip(img, 1)
                 
                 imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+                t1 = time.perf_counter()
                 
-                results = self.hands.process(imgRGB)
+                timestamp_ms = int((time.monotonic() - self._start_time) * 1000)
+                result = self.detector.detect(imgRGB, timestamp_ms)
+                t2 = time.perf_counter()
                 
-                self.process_hand_landmarks(results, img)
+                if result is not None:
+                    self.process_hand_landmarks(result, img)
+                    self.last_hands = result.hands
+                    # async backends report submit-to-result latency, not the submit call
+                    inference_s = result.latency_s if self.detector.is_async else t2 - t1
+                else:
+                    # async backend has no new result yet: keep showing the last hands
+                    draw_hands(img, self.last_hands)
+                    inference_s = t2 - t1
+                t3 = time.perf_counter()
                 # tick FPS after processing a frame
                 self.fps_meter.tick()
                 self.draw_info_overlay(img)
                 
                 cv2.imshow('Hand Gesture Controller', img)
+                t4 = time.perf_counter()
+                
+                stage_times = {
+                    "preprocess": t1 - t0,
+                    "inference": inference_s,
+                    "control": t3 - t2,
+                    "render": t4 - t3,
+                }
+                if getattr(Config, 'GOVERNOR_ENABLED', False):
+                    self.governor.set_target_latency(Config.TARGET_LATENCY_MS)
+                    self.governor.record(stage_times)
+                    if self.governor.update() is not None:
+                        self.apply_governor_level()
+                self.publish_telemetry(stage_times)
                 
                 key = cv2.waitKey(1) & 0xFF
                 if key == 27:  # ESC key
@@ -245,6 +294,12 @@ class HandTrackingApp:
         """
         print("Cleaning up...")
         self.capture.release()
+        self.detector.close()
+        # Release a held button and close open gestures before the bus goes away
+        Controller.hand_lost()
+        if Controller.event_bus is not None:
+            Controller.event_bus.close()
+            Controller.event_bus = None
         cv2.destroyAllWindows()
         print("Application closed successfully")
 
@@ -252,12 +307,17 @@ def main():
     """
     Main function to run the hand tracking app.
     """
+    global active_app
     try:
         app = HandTrackingApp()
+        active_app = app
         app.run()
     except Exception as e:
         print(f"Failed to initialize application: {e}")
         print("Please check your camera connection and try again")
+    finally:
+        active_app = None
+        telemetry.clear()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
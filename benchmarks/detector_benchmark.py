@@ -0,0 +1,114 @@
+"""
+Compare landmark-detector backends on the same recorded input.
+
+Frames are decoded up front so every backend sees identical RGB frames and
+decode cost is excluded. Frames are fed as fast as each backend accepts them;
+for asynchronous backends latency is measured from submit to result callback.
+
+    python -m benchmarks.detector_benchmark --video recording.mp4 --backends solutions,tasks,stub
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+from detection.hand_detector import create_detector
+
+
+def load_frames(path, max_frames):
+    """Decode up to max_frames from a video file into a list of RGB frames."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise Exception(f"Error: Could not open video {path}")
+    frames = []
+    while len(frames) < max_frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB))
+    cap.release()
+    return frames
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def run_backend(name, frames, warmup=5, drain_timeout=2.0, **kwargs):
+    """Feed all frames through one backend and return throughput/latency stats."""
+    detector = create_detector(name, **kwargs)
+    try:
+        for i in range(min(warmup, len(frames))):
+            detector.detect(frames[i], i)
+        # Let async warm-up results land before timing starts
+        time.sleep(0.2 if detector.is_async else 0.0)
+        detector.poll()
+
+        latencies = []
+        base_ts = warmup + 1
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            result = detector.detect(frame, base_ts + i * 33)
+            if result is not None:
+                latencies.append(result.latency_s)
+        submit_elapsed = time.perf_counter() - start
+        if detector.is_async:
+            deadline = time.perf_counter() + drain_timeout
+            while time.perf_counter() < deadline:
+                result = detector.poll()
+                if result is not None:
+                    latencies.append(result.latency_s)
+                    if result.timestamp_ms >= base_ts + (len(frames) - 1) * 33:
+                        break
+                else:
+                    time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+    finally:
+        detector.close()
+
+    return {
+        "backend": name,
+        "frames": len(frames),
+        "results": len(latencies),
+        "submit_fps": len(frames) / submit_elapsed if submit_elapsed > 0 else 0.0,
+        "result_fps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        "p50_ms": 1000 * percentile(latencies, 0.5),
+        "p95_ms": 1000 * percentile(latencies, 0.95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", required=True, help="recorded input video")
+    parser.add_argument("--backends", default="solutions,tasks,stub")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--model-complexity", type=int, default=1)
+    parser.add_argument("--model-path", default=None, help="hand_landmarker.task for the tasks backend")
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.frames)
+    if not frames:
+        print("No frames decoded")
+        return
+    print(f"Loaded {len(frames)} frames from {args.video}")
+    print(f"{'backend':<10} {'frames':>6} {'results':>7} {'submit/s':>9} {'result/s':>9} "
+          f"{'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7}")
+    for name in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        try:
+            stats = run_backend(name, frames, model_complexity=args.model_complexity, model_path=args.model_path)
+        except Exception as e:
+            print(f"{name:<10} failed: {e}")
+            continue
+        print(f"{stats['backend']:<10} {stats['frames']:>6} {stats['results']:>7} {stats['submit_fps']:>9.1f} "
+              f"{stats['result_fps']:>9.1f} {stats['mean_ms']:>8.2f} {stats['p50_ms']:>7.2f} {stats['p95_ms']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
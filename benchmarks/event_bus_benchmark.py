@@ -0,0 +1,110 @@
+"""
+Measure sustained publish rate and subscriber latency of the gesture event bus.
+
+Subscribers run in separate processes and report received count and
+publish-to-receive latency. --slow-ms makes the first subscriber sleep after
+every message to show that a slow subscriber only loses its own messages and
+never slows the publisher down.
+
+    python -m benchmarks.event_bus_benchmark --subscribers 4 --rate 0 --seconds 5
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing as mp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events.event_bus import EventPublisher, EventSubscriber, Gesture, Hand
+from detection.stub_detector import StubHandDetector
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def subscriber_main(path, ready, results, index, seconds, slow_ms):
+    sub = EventSubscriber(path)
+    ready.set()
+    latencies = []
+    received = 0
+    deadline = time.monotonic() + seconds + 2.0
+    while time.monotonic() < deadline:
+        event = sub.recv(timeout=0.5)
+        if event is None:
+            if received:
+                break
+            continue
+        latencies.append(time.monotonic() - event.timestamp)
+        received += 1
+        if slow_ms > 0 and index == 0:
+            time.sleep(slow_ms / 1000.0)
+    sub.close()
+    results.put((index, received, latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--rate", type=float, default=0, help="events per second (0 = as fast as possible)")
+    parser.add_argument("--landmarks", action="store_true", help="publish landmark events instead of gestures")
+    parser.add_argument("--slow-ms", type=float, default=0.0, help="per-message delay in subscriber 0")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.gettempdir(), f"hand-gesture-bench-{os.getpid()}.sock")
+    publisher = EventPublisher(path, poll_interval=0.01)
+    results = mp.Queue()
+    procs = []
+    for i in range(args.subscribers):
+        ready = mp.Event()
+        p = mp.Process(target=subscriber_main, args=(path, ready, results, i, args.seconds, args.slow_ms))
+        p.start()
+        ready.wait(5.0)
+        procs.append(p)
+    publisher.wait_for_subscribers(args.subscribers)
+
+    hand = StubHandDetector().detect(None, 0).hands[0]
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    published = 0
+    slowest_call = 0.0
+    start = time.monotonic()
+    next_time = start
+    while time.monotonic() - start < args.seconds:
+        t0 = time.perf_counter()
+        if args.landmarks:
+            publisher.publish_landmarks(hand, Hand.RIGHT)
+        else:
+            publisher.publish_gesture(Gesture.SCROLL, Hand.RIGHT, 1.0)
+        slowest_call = max(slowest_call, time.perf_counter() - t0)
+        published += 1
+        if interval:
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+    elapsed = time.monotonic() - start
+
+    stats = [results.get(timeout=args.seconds + 10) for _ in procs]
+    for p in procs:
+        p.join(timeout=5.0)
+    publisher.close()
+
+    kind = "landmarks" if args.landmarks else "gesture"
+    print(f"Published {published} {kind} events in {elapsed:.2f}s "
+          f"({published / elapsed:.0f} events/s, slowest publish call {slowest_call * 1e6:.0f}us)")
+    print(f"Datagrams sent {publisher.sent}, dropped {publisher.dropped}")
+    print(f"{'sub':>3} {'received':>9} {'loss %':>7} {'p50 us':>8} {'p99 us':>8} {'max us':>8}")
+    for index, received, latencies in sorted(stats):
+        loss = 100.0 * (1 - received / published) if published else 0.0
+        print(f"{index:>3} {received:>9} {loss:>7.2f} {percentile(latencies, 0.5) * 1e6:>8.0f} "
+              f"{percentile(latencies, 0.99) * 1e6:>8.0f} {max(latencies, default=0) * 1e6:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
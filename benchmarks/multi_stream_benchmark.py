@@ -0,0 +1,126 @@
+"""
+Measure aggregate throughput and per-stream latency of server mode as the
+number of streams grows, on a fixed worker pool.
+
+By default every stream is a synthetic camera and inference is the stub
+backend with a simulated per-frame cost, so the scheduler and load shedding can
+be measured without cameras. Pass --video (and --backend solutions) to
+measure real inference on a recorded file, opened once per stream.
+
+Server mode gives every stream its own detector in tracking mode. Add
+--static-image-mode to run palm detection on every frame instead and compare
+the per-frame cost and memory of the two.
+
+    python -m benchmarks.multi_stream_benchmark --streams 1,2,4,8 --workers 2 --stub-latency-ms 10
+    python -m benchmarks.multi_stream_benchmark --video recording.mp4 --backend solutions [--static-image-mode]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from streams.multi_stream import MultiStreamServer
+from video.capture_manager import CaptureManager
+
+
+class SyntheticSource:
+    """Camera stand-in producing blank frames at a fixed rate."""
+    def __init__(self, fps=30.0, width=640, height=480):
+        self.interval = 1.0 / fps
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self.next_time = time.perf_counter()
+
+    def read(self):
+        delay = self.next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_time = max(self.next_time + self.interval, time.perf_counter() - self.interval)
+        return True, self.frame
+
+    def release(self):
+        pass
+
+
+class LoopingVideo:
+    """Video file source that restarts at the end so runs can last any duration."""
+    def __init__(self, path, fps):
+        self.path = path
+        self.fps = fps
+        self.capture = CaptureManager(path, target_fps=fps)
+
+    def read(self):
+        ok, frame = self.capture.read()
+        if not ok:
+            self.capture.release()
+            self.capture = CaptureManager(self.path, target_fps=self.fps)
+            ok, frame = self.capture.read()
+        return ok, frame
+
+    def release(self):
+        self.capture.release()
+
+
+def run(num_streams, args):
+    if args.video:
+        sources = [LoopingVideo(args.video, args.fps) for _ in range(num_streams)]
+        detector_kwargs = {"model_complexity": args.model_complexity}
+        if args.static_image_mode:
+            detector_kwargs["static_image_mode"] = True
+    else:
+        sources = [SyntheticSource(args.fps, args.width, args.height) for _ in range(num_streams)]
+        detector_kwargs = {"latency_s": args.stub_latency_ms / 1000.0}
+    server = MultiStreamServer(sources, workers=args.workers, backend=args.backend,
+                               max_latency_ms=args.max_latency_ms, detector_kwargs=detector_kwargs).start()
+    time.sleep(args.warmup)
+    start_counts = [s.processed for s in server.streams]
+    for s in server.streams:
+        s.latencies.clear()
+    time.sleep(args.seconds)
+    counts = [s.processed - c for s, c in zip(server.streams, start_counts)]
+    metrics = server.metrics()
+    server.stop()
+
+    per_stream_fps = [c / args.seconds for c in counts]
+    p50 = [s["latency_p50_ms"] for s in metrics["streams"]]
+    p95 = [s["latency_p95_ms"] for s in metrics["streams"]]
+    return {
+        "streams": num_streams,
+        "aggregate_fps": sum(per_stream_fps),
+        "min_fps": min(per_stream_fps),
+        "max_fps": max(per_stream_fps),
+        "p50_ms": sum(p50) / len(p50),
+        "worst_p95_ms": max(p95),
+        "shed_levels": [s["shed_level"] for s in metrics["streams"]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", default="1,2,4,8")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--backend", default="stub")
+    parser.add_argument("--stub-latency-ms", type=float, default=10.0)
+    parser.add_argument("--video", default=None)
+    parser.add_argument("--model-complexity", type=int, default=0)
+    parser.add_argument("--static-image-mode", action="store_true",
+                        help="disable tracking (solutions backend with --video) to measure its cost")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--max-latency-ms", type=float, default=150.0)
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds before measuring (lets shedding settle)")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'streams':>7} {'agg fps':>8} {'min fps':>8} {'max fps':>8} {'p50 ms':>7} {'p95 max':>8}  shed levels")
+    for n in [int(x) for x in args.streams.split(",") if x.strip()]:
+        r = run(n, args)
+        print(f"{r['streams']:>7} {r['aggregate_fps']:>8.1f} {r['min_fps']:>8.1f} {r['max_fps']:>8.1f} "
+              f"{r['p50_ms']:>7.1f} {r['worst_p95_ms']:>8.1f}  {r['shed_levels']}")
+
+
+if __name__ == "__main__":
+    main()
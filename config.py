@@ -33,6 +33,23 @@ DEFAULTS = {
     "TARGET_FPS": 30,
     "FAILSAFE": True,
     "INVERT_HANDS": False,
+    "GOVERNOR_ENABLED": True,
+    "TARGET_LATENCY_MS": 40,
+    "DETECTOR_BACKEND": "solutions",
+    "HAND_LANDMARKER_MODEL": "",
+    "MOTION_GESTURES": True,
+    "HISTORY_SIZE": 32,
+    "SCROLL_SPEED": 20,
+    "SCROLL_DEADZONE": 0.2,
+    "ZOOM_SPEED": 10,
+    "ZOOM_DEADZONE": 0.5,
+    "ZOOM_MIN_PINCH": 0.08,
+    "API_ENABLED": True,
+    "API_HOST": "127.0.0.1",
+    "API_PORT": 8765,
+    "EVENT_BUS_ENABLED": False,
+    "EVENT_BUS_PATH": "",
+    "EVENT_BUS_LANDMARKS": True,
 }
 
 
@@ -52,6 +69,23 @@ class Config:
     TARGET_FPS = user_cfg.get("TARGET_FPS", DEFAULTS["TARGET_FPS"])
     FAILSAFE = user_cfg.get("FAILSAFE", DEFAULTS["FAILSAFE"])
     INVERT_HANDS = user_cfg.get("INVERT_HANDS", DEFAULTS["INVERT_HANDS"])
+    GOVERNOR_ENABLED = user_cfg.get("GOVERNOR_ENABLED", DEFAULTS["GOVERNOR_ENABLED"])
+    TARGET_LATENCY_MS = user_cfg.get("TARGET_LATENCY_MS", DEFAULTS["TARGET_LATENCY_MS"])
+    DETECTOR_BACKEND = user_cfg.get("DETECTOR_BACKEND", DEFAULTS["DETECTOR_BACKEND"])
+    HAND_LANDMARKER_MODEL = user_cfg.get("HAND_LANDMARKER_MODEL", DEFAULTS["HAND_LANDMARKER_MODEL"])
+    MOTION_GESTURES = user_cfg.get("MOTION_GESTURES", DEFAULTS["MOTION_GESTURES"])
+    HISTORY_SIZE = user_cfg.get("HISTORY_SIZE", DEFAULTS["HISTORY_SIZE"])
+    SCROLL_SPEED = user_cfg.get("SCROLL_SPEED", DEFAULTS["SCROLL_SPEED"])
+    SCROLL_DEADZONE = user_cfg.get("SCROLL_DEADZONE", DEFAULTS["SCROLL_DEADZONE"])
+    ZOOM_SPEED = user_cfg.get("ZOOM_SPEED", DEFAULTS["ZOOM_SPEED"])
+    ZOOM_DEADZONE = user_cfg.get("ZOOM_DEADZONE", DEFAULTS["ZOOM_DEADZONE"])
+    ZOOM_MIN_PINCH = user_cfg.get("ZOOM_MIN_PINCH", DEFAULTS["ZOOM_MIN_PINCH"])
+    API_ENABLED = user_cfg.get("API_ENABLED", DEFAULTS["API_ENABLED"])
+    API_HOST = user_cfg.get("API_HOST", DEFAULTS["API_HOST"])
+    API_PORT = user_cfg.get("API_PORT", DEFAULTS["API_PORT"])
+    EVENT_BUS_ENABLED = user_cfg.get("EVENT_BUS_ENABLED", DEFAULTS["EVENT_BUS_ENABLED"])
+    EVENT_BUS_PATH = user_cfg.get("EVENT_BUS_PATH", DEFAULTS["EVENT_BUS_PATH"])
+    EVENT_BUS_LANDMARKS = user_cfg.get("EVENT_BUS_LANDMARKS", DEFAULTS["EVENT_BUS_LANDMARKS"])
 
     # Shared state for controller
     running = False
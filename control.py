@@ -0,0 +1,164 @@
+"""
+Controller lifecycle and config updates shared by every control surface
+(Gradio UI in main.py, local HTTP/WebSocket API in api/http_server.py).
+Nothing here imports a UI toolkit, and the frame loop (app: cv2, pyautogui)
+is only imported when the controller is started.
+"""
+import math
+import threading
+from config import Config
+from detection.hand_detector import BACKENDS
+
+controller_thread = None
+
+
+def _parse_bool(value):
+    """JSON booleans, or the strings true/false/1/0. bool("false") would be True."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "1"):
+        return True
+    if isinstance(value, str) and value.strip().lower() in ("false", "0"):
+        return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def _parse_float(value):
+    """Finite number (JSON NaN/Infinity would break every frame's arithmetic)."""
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"expected a finite number, got {value!r}")
+    return number
+
+
+def _parse_int(value):
+    number = _parse_float(value)
+    if number != int(number):
+        raise ValueError(f"expected an integer, got {value!r}")
+    return int(number)
+
+
+def _parse_backend(value):
+    backend = str(value).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown detector backend {value!r} (expected one of {', '.join(BACKENDS)})")
+    return backend
+
+
+# Keys accepted from remote config updates, with the function each value is validated and coerced by
+CONFIG_TYPES = {
+    "PAUSE": _parse_float,
+    "SMOOTHING_FACTOR": _parse_float,
+    "MIN_MOVEMENT_THRESHOLD": _parse_float,
+    "SENSITIVITY": _parse_float,
+    "TARGET_FPS": _parse_int,
+    "FAILSAFE": _parse_bool,
+    "INVERT_HANDS": _parse_bool,
+    "GOVERNOR_ENABLED": _parse_bool,
+    "TARGET_LATENCY_MS": _parse_float,
+    "DETECTOR_BACKEND": _parse_backend,
+    "HAND_LANDMARKER_MODEL": str,
+    "MOTION_GESTURES": _parse_bool,
+    "HISTORY_SIZE": _parse_int,
+    "SCROLL_SPEED": _parse_float,
+    "SCROLL_DEADZONE": _parse_float,
+    "ZOOM_SPEED": _parse_float,
+    "ZOOM_DEADZONE": _parse_float,
+    "ZOOM_MIN_PINCH": _parse_float,
+    "EVENT_BUS_LANDMARKS": _parse_bool,
+}
+
+# Inclusive (min, max) for numeric keys; the first six match the Gradio sliders in main.py
+CONFIG_RANGES = {
+    "PAUSE": (0.0001, 0.01),
+    "SMOOTHING_FACTOR": (0.0, 1.0),
+    "MIN_MOVEMENT_THRESHOLD": (0, 100),
+    "SENSITIVITY": (0.1, 50.0),
+    "TARGET_FPS": (5, 60),
+    "TARGET_LATENCY_MS": (10, 200),
+    "HISTORY_SIZE": (3, 256),
+    "SCROLL_SPEED": (0.0, 200.0),
+    "SCROLL_DEADZONE": (0.0, 10.0),
+    "ZOOM_SPEED": (0.0, 200.0),
+    "ZOOM_DEADZONE": (0.0, 10.0),
+    "ZOOM_MIN_PINCH": (0.0, 0.5),
+}
+
+
+def apply_config(cfg):
+    """
+    Validate, coerce and apply a partial config dict, then persist it.
+    Unknown keys, invalid values or numbers outside CONFIG_RANGES raise
+    ValueError and nothing is applied.
+    Returns the applied values.
+    """
+    unknown = [k for k in cfg if k not in CONFIG_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(unknown)}")
+    clean = {}
+    for k, v in cfg.items():
+        try:
+            clean[k] = CONFIG_TYPES[k](v)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError(f"Invalid value for {k}: {e}")
+        if k in CONFIG_RANGES:
+            lo, hi = CONFIG_RANGES[k]
+            if not lo <= clean[k] <= hi:
+                raise ValueError(f"Invalid value for {k}: {clean[k]} is outside [{lo}, {hi}]")
+    Config.update_from_dict(clean)
+    return clean
+
+
+def config_snapshot():
+    """Current config values (plain attribute reads, no locking)."""
+    return {k: getattr(Config, k, None) for k in CONFIG_TYPES}
+
+
+def start_controller():
+    """
+    Start the hand gesture controller in a background thread.
+    """
+    global controller_thread
+    import app
+    with Config.lock:
+        if Config.running:
+            return "Controller already running."
+        Config.running = True
+    def run_app():
+        try:
+            app.main()
+        except Exception as e:
+            print(f"Controller stopped: {e}")
+        finally:
+            with Config.lock:
+                Config.running = False
+    controller_thread = threading.Thread(target=run_app, daemon=True)
+    controller_thread.start()
+    return "Controller started!"
+
+
+def stop_controller():
+    """
+    Stop the controller by setting the running flag to False.
+    """
+    with Config.lock:
+        Config.running = False
+    return "Controller stopping... (may take a moment)"
+
+
+def is_running():
+    return bool(Config.running)
+
+
+def get_status():
+    if is_running():
+        return "Controller is RUNNING"
+    return "Controller is STOPPED"
+
+
+def reset_smoothing():
+    from controller import Controller
+    Controller.reset_smoothing()
+    return "Smoothing reset!"
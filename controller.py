@@ -3,6 +3,9 @@ import pyautogui
 import math
 import time
 import threading
+from utils.finger_status import compute_finger_status, is_finger_near_thumb
+from utils.gesture_state import GestureState
+from events.event_bus import Gesture, Hand
 
 class Controller:
     # State variables
@@ -46,10 +49,12 @@ class Controller:
     _smoothed_hand_y = None
     _prev_cursor_x = None
     _prev_cursor_y = None
-    # Left-click hold state (for three-finger pinch)
-    _left_hold = False
-    # Debounce for right click on middle-thumb pinch
-    _right_click_pressed = False
+
+    # Gesture state machine (shared with server-mode streams); Controller acts on its actions
+    gestures = GestureState()
+
+    # Optional events.event_bus.EventPublisher; recognized gestures are published when set
+    event_bus = None
 
     # Config sync lock
     _config_lock = threading.Lock()
@@ -63,6 +68,65 @@ class Controller:
             pyautogui.PAUSE = Config.PAUSE
             # Config values are accessed directly now
 
+    @staticmethod
+    def _emit(gesture, hand=Hand.UNKNOWN, x=0.0, y=0.0):
+        """Publish a gesture event if an event bus is attached (never blocks)."""
+        bus = Controller.event_bus
+        if bus is None:
+            return
+        try:
+            bus.publish_gesture(gesture, hand, x, y)
+        except Exception as e:
+            print(f"Event bus error: {e}")
+
+    @staticmethod
+    def _act(actions):
+        """Perform the OS input for each GestureAction and publish it."""
+        for gesture, hand, value in actions:
+            try:
+                if gesture == Gesture.LEFT_HOLD_START:
+                    pyautogui.mouseDown(button='left')
+                elif gesture == Gesture.LEFT_HOLD_END:
+                    pyautogui.mouseUp(button='left')
+                elif gesture == Gesture.RIGHT_CLICK:
+                    pyautogui.click(button='right')
+                elif gesture == Gesture.SCROLL:
+                    pyautogui.scroll(int(value))
+                elif gesture == Gesture.ZOOM:
+                    # Ctrl + scroll, which most applications treat as zoom
+                    pyautogui.keyDown('ctrl')
+                    try:
+                        pyautogui.scroll(int(value))
+                    finally:
+                        pyautogui.keyUp('ctrl')
+            except pyautogui.FailSafeException:
+                print("PyAutoGUI fail-safe triggered - move mouse to corner to stop")
+            except Exception as e:
+                print(f"Gesture action error ({gesture.name}): {e}")
+            Controller._emit(gesture, hand, value)
+
+    @staticmethod
+    def process_hands(right_hand, left_hand, timestamp=None, motion_gestures=True):
+        """
+        Run the gesture state machine on one frame's hands, act on the resulting
+        actions and move the cursor with the movement hand.
+        """
+        actions = Controller.gestures.update(right_hand, left_hand,
+                                             time.time() if timestamp is None else timestamp,
+                                             motion_gestures)
+        Controller._act(actions)
+        Controller.hand_Landmarks = right_hand
+        if right_hand is not None:
+            Controller.update_fingers_status()
+            Controller.cursor_moving()
+
+    @staticmethod
+    def hand_lost():
+        """Release everything the hands were doing and publish HAND_LOST."""
+        Controller._act(Controller.gestures.hand_lost())
+        Controller.hand_Landmarks = None
+        Controller.reset_smoothing()
+
     @staticmethod
     def update_fingers_status():
         """
@@ -71,28 +135,9 @@ class Controller:
         if not Controller.hand_Landmarks or not Controller.hand_Landmarks.landmark:
             return
         try:
-            lm = Controller.hand_Landmarks.landmark
-            Controller.little_finger_down = lm[20].y > lm[17].y
-            Controller.little_finger_up = lm[20].y < lm[17].y
-            Controller.index_finger_down = lm[8].y > lm[5].y
-            Controller.index_finger_up = lm[8].y < lm[5].y
-            Controller.middle_finger_down = lm[12].y > lm[9].y
-            Controller.middle_finger_up = lm[12].y < lm[9].y
-            Controller.ring_finger_down = lm[16].y > lm[13].y
-            Controller.ring_finger_up = lm[16].y < lm[13].y
-            Controller.thumb_finger_down = lm[4].y > lm[3].y
-            Controller.thumb_finger_up = lm[4].y < lm[3].y
-            Controller.all_fingers_down = (
-                Controller.index_finger_down and Controller.middle_finger_down and
-                Controller.ring_finger_down and Controller.little_finger_down)
-            Controller.all_fingers_up = (
-                Controller.index_finger_up and Controller.middle_finger_up and
-                Controller.ring_finger_up and Controller.little_finger_up)
-            thumb_tip = lm[4]
-            Controller.index_finger_within_thumb_finger = Controller._is_finger_near_thumb(lm[8], thumb_tip)
-            Controller.middle_finger_within_thumb_finger = Controller._is_finger_near_thumb(lm[12], thumb_tip)
-            Controller.ring_finger_within_thumb_finger = Controller._is_finger_near_thumb(lm[16], thumb_tip)
-            Controller.little_finger_within_thumb_finger = Controller._is_finger_near_thumb(lm[20], thumb_tip)
+            status = compute_finger_status(Controller.hand_Landmarks.landmark)
+            for name, value in status.items():
+                setattr(Controller, name, value)
         except (IndexError, AttributeError) as e:
             print(f"Error updating finger status: {e}")
 
@@ -101,9 +146,7 @@ class Controller:
         """
         Check if finger tip is close to thumb tip using Euclidean distance
         """
-        dx = finger_tip.x - thumb_tip.x
-        dy = finger_tip.y - thumb_tip.y
-        return math.hypot(dx, dy) < threshold
+        return is_finger_near_thumb(finger_tip, thumb_tip, threshold)
 
     @staticmethod
     def get_position(hand_x_position, hand_y_position):
@@ -152,31 +195,24 @@ class Controller:
     def cursor_moving():
         """
         Moves the cursor based on hand gestures, using a velocity-based model.
-        Movement is only active when thumb and index finger are pinched.
+        Movement is only active while the gesture state machine reports the
+        movement pinch and no freeze.
         """
         if not Controller.hand_Landmarks or not Controller.hand_Landmarks.landmark:
             return
 
+        gestures = Controller.gestures
+        # Freeze gesture (all fingers up while thumb down, still pinched) -> no movement
+        if gestures.frozen:
+            Controller.reset_smoothing()
+            return
         # Only move cursor if thumb and index finger are pinched
-        if not Controller.index_finger_within_thumb_finger:
+        if not gestures.moving:
             # Reset state when not pinching to prevent jumps on re-pinch
             Controller._prev_time = None
             Controller._prev_cursor_x = None
             Controller._prev_cursor_y = None
-            # Ensure left button is released if it was held
-            Controller.release_left_hold()
             return
-
-        # Freeze gesture: all fingers up while thumb down -> no movement
-        try:
-            if Controller.all_fingers_up and Controller.thumb_finger_down:
-                Controller.reset_smoothing()
-                # Ensure left button is released while frozen
-                Controller.release_left_hold()
-                return
-        except Exception:
-            # If attributes missing, ignore
-            pass
         try:
             # Use the midpoint of the ring and little finger tips for tracking (Right hand only)
             ring_finger_tip = Controller.hand_Landmarks.landmark[16]
@@ -232,46 +268,8 @@ class Controller:
 
     @staticmethod
     def release_left_hold():
-        """Release left mouse button if currently held by triple pinch."""
-        try:
-            if getattr(Controller, '_left_hold', False):
-                try:
-                    pyautogui.mouseUp(button='left')
-                except pyautogui.FailSafeException:
-                    print("PyAutoGUI fail-safe triggered - move mouse to corner to stop")
-                Controller._left_hold = False
-        except Exception as e:
-            print(f"Error releasing left hold: {e}")
-
-    @staticmethod
-    def handle_left_click_hold(index_thumb_pinch: bool):
-        """Press/hold left button while index-thumb pinch is true; release on unpinch."""
-        try:
-            if index_thumb_pinch and not Controller._left_hold:
-                try:
-                    pyautogui.mouseDown(button='left')
-                    Controller._left_hold = True
-                except pyautogui.FailSafeException:
-                    print("PyAutoGUI fail-safe triggered - move mouse to corner to stop")
-            elif not index_thumb_pinch and Controller._left_hold:
-                Controller.release_left_hold()
-        except Exception as e:
-            print(f"Left click hold error: {e}")
-
-    @staticmethod
-    def handle_right_click(middle_thumb_pinch: bool):
-        """Single right click on rising edge of middle-thumb pinch."""
-        try:
-            if middle_thumb_pinch and not Controller._right_click_pressed:
-                try:
-                    pyautogui.click(button='right')
-                except pyautogui.FailSafeException:
-                    print("PyAutoGUI fail-safe triggered - move mouse to corner to stop")
-                Controller._right_click_pressed = True
-            elif not middle_thumb_pinch and Controller._right_click_pressed:
-                Controller._right_click_pressed = False
-        except Exception as e:
-            print(f"Right click error: {e}")
+        """Release the left mouse button if the click-hand pinch is holding it."""
+        Controller._act(Controller.gestures.release_left_hold())
 
 def initialize_controller():
     """
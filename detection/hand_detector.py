@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional, Tuple
+
+# Same topology as mediapipe.solutions.hands.HAND_CONNECTIONS, kept here so
+# drawing does not depend on which backend produced the landmarks.
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+NUM_LANDMARKS = 21
+
+# Names accepted by create_detector (DETECTOR_BACKEND)
+BACKENDS = ("solutions", "tasks", "stub")
+
+
+class Landmark(NamedTuple):
+    """Normalized landmark: x, y in [0, 1] image coordinates, z relative depth."""
+    x: float
+    y: float
+    z: float = 0.0
+
+
+class HandLandmarks(NamedTuple):
+    """
+    One detected hand. `landmark` mirrors the Mediapipe attribute name so the
+    Controller can read `hand.landmark[i].x` regardless of backend.
+    `label` is the raw model handedness ('Left'/'Right') or None.
+    """
+    landmark: Tuple[Landmark, ...]
+    label: Optional[str] = None
+    score: float = 0.0
+
+
+class DetectionResult(NamedTuple):
+    """
+    Landmarks for one frame. `timestamp_ms` is the timestamp of the frame the
+    result belongs to, `latency_s` the time from submitting that frame to the
+    result being available.
+    """
+    hands: Tuple[HandLandmarks, ...]
+    timestamp_ms: int
+    latency_s: float = 0.0
+
+
+class HandDetector(ABC):
+    """
+    Interface between the frame loop and a landmark model.
+
+    detect() takes an RGB frame and a strictly increasing timestamp in
+    milliseconds and returns a DetectionResult, or None when no new result is
+    available yet (asynchronous backends). Synchronous backends always return
+    the result for the frame they were given.
+    """
+    name = "base"
+    is_async = False
+    # Whether set_model_complexity() can change the model (the governor skips levels it cannot apply)
+    supports_model_complexity = False
+
+    @abstractmethod
+    def detect(self, image_rgb, timestamp_ms: int) -> Optional[DetectionResult]:
+        ...
+
+    def poll(self) -> Optional[DetectionResult]:
+        """Return a newly completed result without submitting a frame (async backends)."""
+        return None
+
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        """Switch model complexity; return True if the model was rebuilt."""
+        return False
+
+    def close(self):
+        pass
+
+
+def create_detector(backend: str = "solutions", **kwargs) -> HandDetector:
+    """
+    Build a detector by backend name: 'solutions' (synchronous mp.solutions.hands),
+    'tasks' (MediaPipe Tasks hand landmarker, async live-stream) or 'stub'.
+    Backends are imported lazily so unused ones do not need their dependencies.
+    """
+    backend = (backend or "solutions").lower()
+    if backend == "solutions":
+        from detection.solutions_detector import SolutionsHandDetector
+        return SolutionsHandDetector(**kwargs)
+    if backend == "tasks":
+        from detection.tasks_detector import TasksLiveStreamDetector
+        return TasksLiveStreamDetector(**kwargs)
+    if backend == "stub":
+        from detection.stub_detector import StubHandDetector
+        return StubHandDetector(**kwargs)
+    raise ValueError(f"Unknown detector backend: {backend}")
+
+
+def assign_hands(hands, invert=False):
+    """
+    Split detected hands into (right_hand, left_hand) from the user's point of
+    view for a horizontally flipped preview. Uses model handedness when present,
+    otherwise the rightmost wrist is the right hand. `invert` swaps the roles.
+    """
+    right_hand = None
+    left_hand = None
+    if any(hand.label for hand in hands):
+        for hand in hands:
+            # The image was flipped horizontally, so model labels are inverted
+            if hand.label == 'Left' and right_hand is None:
+                right_hand = hand
+            elif hand.label == 'Right' and left_hand is None:
+                left_hand = hand
+    elif len(hands) == 1:
+        right_hand = hands[0]
+    elif len(hands) >= 2:
+        if hands[0].landmark[0].x >= hands[1].landmark[0].x:
+            right_hand, left_hand = hands[0], hands[1]
+        else:
+            right_hand, left_hand = hands[1], hands[0]
+    if invert:
+        right_hand, left_hand = left_hand, right_hand
+    return right_hand, left_hand
+
+
+def draw_hands(img, hands, point_color=(0, 0, 255), line_color=(0, 255, 0)):
+    """Draw landmarks and connections for each hand onto a BGR image."""
+    import cv2  # local: control/API import this module for BACKENDS without OpenCV
+    height, width = img.shape[:2]
+    for hand in hands:
+        points = [(int(p.x * width), int(p.y * height)) for p in hand.landmark]
+        for a, b in HAND_CONNECTIONS:
+            cv2.line(img, points[a], points[b], line_color, 2)
+        for pt in points:
+            cv2.circle(img, pt, 2, point_color, 2)
@@ -0,0 +1,64 @@
+import time
+import mediapipe as mp
+from typing import Optional
+
+from detection.hand_detector import HandDetector, HandLandmarks, Landmark, DetectionResult
+
+
+class SolutionsHandDetector(HandDetector):
+    """
+    Synchronous backend over mp.solutions.hands.Hands. detect() blocks until
+    inference for the given frame has finished.
+    """
+    name = "solutions"
+    is_async = False
+    supports_model_complexity = True
+
+    def __init__(self, max_num_hands: int = 2, model_complexity: int = 1, static_image_mode: bool = False,
+                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5, **_):
+        self.max_num_hands = max_num_hands
+        self.static_image_mode = static_image_mode
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.model_complexity = model_complexity
+        self.mpHands = mp.solutions.hands # type: ignore
+        self.hands = self._build_hands(model_complexity)
+
+    def _build_hands(self, model_complexity):
+        """Create a Mediapipe Hands graph with the given model complexity (0 = lite, 1 = full)."""
+        return self.mpHands.Hands(
+            static_image_mode=self.static_image_mode,
+            max_num_hands=self.max_num_hands,
+            model_complexity=model_complexity,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        if model_complexity == self.model_complexity:
+            return False
+        self.hands.close()
+        self.hands = self._build_hands(model_complexity)
+        self.model_complexity = model_complexity
+        return True
+
+    def detect(self, image_rgb, timestamp_ms: int) -> Optional[DetectionResult]:
+        start = time.perf_counter()
+        results = self.hands.process(image_rgb)
+        hands = []
+        if results.multi_hand_landmarks:
+            handedness_list = getattr(results, 'multi_handedness', None) or []
+            for i, lm in enumerate(results.multi_hand_landmarks):
+                label, score = None, 0.0
+                if i < len(handedness_list):
+                    category = handedness_list[i].classification[0]
+                    label, score = category.label, category.score
+                points = tuple(Landmark(p.x, p.y, p.z) for p in lm.landmark)
+                hands.append(HandLandmarks(points, label, score))
+        return DetectionResult(tuple(hands), timestamp_ms, time.perf_counter() - start)
+
+    def close(self):
+        try:
+            self.hands.close()
+        except Exception:
+            pass
@@ -0,0 +1,67 @@
+import math
+import time
+from typing import Optional
+
+from detection.hand_detector import HandDetector, HandLandmarks, Landmark, DetectionResult
+
+# Open right hand, palm facing the camera, as (dx, dy) offsets from the wrist
+# in units of hand size. Index order follows the Mediapipe hand model.
+_OPEN_HAND = (
+    (0.00, 0.00),                                                  # wrist
+    (-0.20, -0.10), (-0.35, -0.25), (-0.45, -0.40), (-0.52, -0.55),  # thumb
+    (-0.15, -0.55), (-0.17, -0.75), (-0.18, -0.88), (-0.19, -1.00),  # index
+    (0.00, -0.58), (0.00, -0.80), (0.00, -0.94), (0.00, -1.06),      # middle
+    (0.14, -0.55), (0.15, -0.75), (0.16, -0.87), (0.17, -0.98),      # ring
+    (0.26, -0.48), (0.29, -0.63), (0.31, -0.73), (0.33, -0.83),      # little
+)
+
+
+class StubHandDetector(HandDetector):
+    """
+    Deterministic backend for tests and benchmarks. The output depends only on
+    how many frames have been submitted: the hand traces a fixed Lissajous path
+    and pinches index to thumb for the second half of every `pinch_period`
+    frames. `latency_s` simulates inference cost by sleeping.
+    """
+    name = "stub"
+    is_async = False
+    supports_model_complexity = True
+
+    def __init__(self, num_hands: int = 1, hand_size: float = 0.25, pinch_period: int = 60,
+                 latency_s: float = 0.0, model_complexity: int = 1, **_):
+        self.num_hands = max(0, min(num_hands, 2))
+        self.hand_size = hand_size
+        self.pinch_period = max(2, pinch_period)
+        self.latency_s = latency_s
+        self.model_complexity = model_complexity
+        self.frame_index = 0
+
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        changed = model_complexity != self.model_complexity
+        self.model_complexity = model_complexity
+        return changed
+
+    def _hand(self, cx: float, cy: float, mirror: bool, pinch: bool) -> HandLandmarks:
+        sign = -1.0 if mirror else 1.0
+        points = [Landmark(cx + sign * dx * self.hand_size, cy + dy * self.hand_size)
+                  for dx, dy in _OPEN_HAND]
+        if pinch:
+            points[8] = points[4]
+        # Raw model labels are mirrored; the app inverts them for the flipped preview
+        return HandLandmarks(tuple(points), 'Right' if mirror else 'Left', 1.0)
+
+    def detect(self, image_rgb, timestamp_ms: int) -> Optional[DetectionResult]:
+        start = time.perf_counter()
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        t = self.frame_index
+        self.frame_index += 1
+        pinch = (t % self.pinch_period) >= self.pinch_period // 2
+        cx = 0.65 + 0.15 * math.sin(t * 0.05)
+        cy = 0.70 + 0.10 * math.sin(t * 0.08)
+        hands = []
+        if self.num_hands >= 1:
+            hands.append(self._hand(cx, cy, False, pinch))
+        if self.num_hands >= 2:
+            hands.append(self._hand(1.0 - cx, cy, True, pinch))
+        return DetectionResult(tuple(hands), timestamp_ms, time.perf_counter() - start)
@@ -0,0 +1,86 @@
+import os
+import time
+import threading
+import mediapipe as mp
+from mediapipe.tasks import python as mp_tasks
+from mediapipe.tasks.python import vision
+from typing import Optional
+
+from detection.hand_detector import HandDetector, HandLandmarks, Landmark, DetectionResult
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'hand_landmarker.task')
+
+
+class TasksLiveStreamDetector(HandDetector):
+    """
+    Asynchronous backend over the MediaPipe Tasks HandLandmarker in LIVE_STREAM
+    mode. detect() only submits the frame and returns immediately with the most
+    recent result completed since the last call (or None), so capture never
+    waits on inference. MediaPipe drops frames internally while it is busy.
+
+    Requires the hand_landmarker.task model bundle (see HAND_LANDMARKER_MODEL).
+    """
+    name = "tasks"
+    is_async = True
+    supports_model_complexity = False  # single-model task bundle
+
+    def __init__(self, model_path: Optional[str] = None, max_num_hands: int = 2, model_complexity: int = 1,
+                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5, **_):
+        model_path = model_path or DEFAULT_MODEL_PATH
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Hand landmarker model not found: {model_path}")
+        # The task bundle has a single model; complexity is accepted for interface parity only.
+        self.model_complexity = model_complexity
+        self._lock = threading.Lock()
+        self._latest = None
+        self._submitted = {}
+        self._last_timestamp_ms = -1
+        options = vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result,
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result, output_image, timestamp_ms: int):
+        """Called on a MediaPipe thread when inference for a frame finishes."""
+        done = time.perf_counter()
+        hands = []
+        for i, lm in enumerate(result.hand_landmarks or []):
+            label, score = None, 0.0
+            if result.handedness and i < len(result.handedness) and result.handedness[i]:
+                category = result.handedness[i][0]
+                label, score = category.category_name, category.score
+            points = tuple(Landmark(p.x, p.y, p.z) for p in lm)
+            hands.append(HandLandmarks(points, label, score))
+        with self._lock:
+            submitted = self._submitted.pop(timestamp_ms, done)
+            # Frames MediaPipe dropped never call back; forget their submit times
+            for ts in [ts for ts in self._submitted if ts < timestamp_ms]:
+                del self._submitted[ts]
+            self._latest = DetectionResult(tuple(hands), timestamp_ms, done - submitted)
+
+    def detect(self, image_rgb, timestamp_ms: int) -> Optional[DetectionResult]:
+        # Live-stream mode requires strictly increasing timestamps
+        timestamp_ms = max(int(timestamp_ms), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        with self._lock:
+            self._submitted[timestamp_ms] = time.perf_counter()
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
+        self.landmarker.detect_async(mp_image, timestamp_ms)
+        return self.poll()
+
+    def poll(self) -> Optional[DetectionResult]:
+        with self._lock:
+            result, self._latest = self._latest, None
+        return result
+
+    def close(self):
+        try:
+            self.landmarker.close()
+        except Exception:
+            pass
@@ -0,0 +1,280 @@
+"""
+Publish/subscribe bus for recognized gestures and hand landmarks between
+local processes, over Unix datagram sockets.
+
+Every message is one datagram with a fixed little-endian layout:
+
+    header    (20 bytes)  version u8, kind u8, gesture u8, hand u8,
+                          source u16, reserved u16, seq u32, timestamp f64
+    GESTURE   (+8 bytes)  x f32, y f32   (gesture-specific value, e.g. scroll steps)
+    LANDMARKS (+252)      21 x (x, y, z) f32
+
+`timestamp` is time.monotonic() of the publisher; on the same host it can be
+compared with the subscriber's time.monotonic() to measure delivery latency.
+`source` identifies the video stream (0 for the local app).
+
+The publisher never blocks: its socket is non-blocking and a datagram that
+does not fit in a subscriber's receive buffer is dropped and counted.
+Subscribers register by sending a SUB datagram to the publisher's socket path.
+"""
+import os
+import stat
+import time
+import socket
+import struct
+import tempfile
+from enum import IntEnum
+from typing import NamedTuple, Optional, Tuple
+
+PROTOCOL_VERSION = 1
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'hand-gesture-events.sock')
+
+HEADER = struct.Struct('<BBBBHHId')
+GESTURE_BODY = struct.Struct('<ff')
+LANDMARKS_BODY = struct.Struct('<63f')
+GESTURE_SIZE = HEADER.size + GESTURE_BODY.size
+LANDMARKS_SIZE = HEADER.size + LANDMARKS_BODY.size
+
+_SUBSCRIBE = b'SUB'
+_UNSUBSCRIBE = b'UNS'
+
+
+class EventKind(IntEnum):
+    GESTURE = 1
+    LANDMARKS = 2
+
+
+class Gesture(IntEnum):
+    NONE = 0
+    MOVE_START = 1       # movement pinch (thumb + index) engaged
+    MOVE_END = 2
+    LEFT_HOLD_START = 3  # left button pressed (click-hand pinch-hold)
+    LEFT_HOLD_END = 4
+    RIGHT_CLICK = 5
+    FREEZE_START = 6
+    FREEZE_END = 7
+    SCROLL = 8           # x = scroll steps
+    ZOOM = 9             # x = zoom steps
+    HAND_LOST = 10
+
+
+class Hand(IntEnum):
+    UNKNOWN = 0
+    RIGHT = 1  # movement hand
+    LEFT = 2   # click hand
+
+
+class GestureEvent(NamedTuple):
+    gesture: Gesture
+    hand: Hand
+    source: int
+    seq: int
+    timestamp: float
+    x: float
+    y: float
+
+
+class LandmarkEvent(NamedTuple):
+    hand: Hand
+    source: int
+    seq: int
+    timestamp: float
+    points: Tuple[float, ...]  # flat x0, y0, z0, x1, ...
+
+
+def decode(data: bytes):
+    """Decode one datagram into a GestureEvent or LandmarkEvent (None if unrecognized)."""
+    if len(data) < HEADER.size:
+        return None
+    version, kind, gesture, hand, source, _, seq, ts = HEADER.unpack_from(data)
+    if version != PROTOCOL_VERSION:
+        return None
+    if kind == EventKind.GESTURE and len(data) == GESTURE_SIZE:
+        x, y = GESTURE_BODY.unpack_from(data, HEADER.size)
+        return GestureEvent(Gesture(gesture), Hand(hand), source, seq, ts, x, y)
+    if kind == EventKind.LANDMARKS and len(data) == LANDMARKS_SIZE:
+        return LandmarkEvent(Hand(hand), source, seq, ts, LANDMARKS_BODY.unpack_from(data, HEADER.size))
+    return None
+
+
+def _publisher_alive(path: str) -> bool:
+    """True if a socket at `path` still has a live process bound to it."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        probe.connect(path)
+        return True
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False  # stale socket file left by a publisher that exited
+    finally:
+        probe.close()
+
+
+class EventPublisher:
+    """
+    Non-blocking publisher bound at `path`. Call from a single thread (the
+    frame loop). Subscription requests are drained from publish() at most
+    every `poll_interval` seconds, so no extra thread is needed.
+    A stale socket file at `path` is replaced; if another publisher is still
+    bound there, or `path` is not a socket, OSError is raised instead.
+    """
+    def __init__(self, path: str = DEFAULT_PATH, max_subscribers: int = 32, poll_interval: float = 0.05):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError("Unix domain sockets are not available on this platform")
+        self.path = path
+        self.max_subscribers = max_subscribers
+        self.poll_interval = poll_interval
+        self._next_poll = 0.0
+        self.subscribers = {}  # address -> dropped count
+        self.sent = 0
+        self.dropped = 0
+        self._seq = 0
+        self._gesture_buf = bytearray(GESTURE_SIZE)
+        self._landmarks_buf = bytearray(LANDMARKS_SIZE)
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            if _publisher_alive(path):
+                raise OSError(f"another event publisher is already bound to {path}")
+            os.unlink(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(path)
+        self.sock.setblocking(False)
+
+    def _poll_subscriptions(self):
+        """Drain pending SUB/UNS requests, at most once per poll_interval."""
+        now = time.monotonic()
+        if now < self._next_poll:
+            return
+        self._next_poll = now + self.poll_interval
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(16)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            if not addr:
+                continue  # unbound client cannot receive anything
+            if data == _SUBSCRIBE and (addr in self.subscribers or len(self.subscribers) < self.max_subscribers):
+                self.subscribers.setdefault(addr, 0)
+            elif data == _UNSUBSCRIBE:
+                self.subscribers.pop(addr, None)
+
+    def wait_for_subscribers(self, count: int, timeout: float = 5.0) -> bool:
+        """Block until at least `count` subscribers registered (setup/benchmarks only)."""
+        deadline = time.monotonic() + timeout
+        while len(self.subscribers) < count and time.monotonic() < deadline:
+            self._poll_subscriptions()
+            time.sleep(0.01)
+        return len(self.subscribers) >= count
+
+    def _send(self, message):
+        self._poll_subscriptions()
+        for addr in list(self.subscribers):
+            try:
+                self.sock.sendto(message, addr)
+                self.sent += 1
+            except (BlockingIOError, InterruptedError):
+                # Slow subscriber: its buffer is full, drop rather than wait
+                self.subscribers[addr] += 1
+                self.dropped += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                del self.subscribers[addr]
+            except OSError:
+                self.subscribers[addr] += 1
+                self.dropped += 1
+
+    def _next_seq(self) -> int:
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        return self._seq
+
+    def publish_gesture(self, gesture: int, hand: int = Hand.UNKNOWN, x: float = 0.0, y: float = 0.0,
+                        source: int = 0, timestamp: Optional[float] = None):
+        if not self.subscribers:
+            self._poll_subscriptions()
+            if not self.subscribers:
+                return
+        HEADER.pack_into(self._gesture_buf, 0, PROTOCOL_VERSION, EventKind.GESTURE, int(gesture), int(hand),
+                         source, 0, self._next_seq(), time.monotonic() if timestamp is None else timestamp)
+        GESTURE_BODY.pack_into(self._gesture_buf, HEADER.size, x, y)
+        self._send(self._gesture_buf)
+
+    def publish_landmarks(self, hand_landmarks, hand: int = Hand.UNKNOWN, source: int = 0,
+                          timestamp: Optional[float] = None):
+        """Publish 21 landmarks of one hand (anything with .landmark[i].x/.y/.z)."""
+        if not self.subscribers:
+            self._poll_subscriptions()
+            if not self.subscribers:
+                return
+        HEADER.pack_into(self._landmarks_buf, 0, PROTOCOL_VERSION, EventKind.LANDMARKS, 0, int(hand),
+                         source, 0, self._next_seq(), time.monotonic() if timestamp is None else timestamp)
+        flat = []
+        for p in hand_landmarks.landmark[:21]:
+            flat.extend((p.x, p.y, getattr(p, 'z', 0.0)))
+        LANDMARKS_BODY.pack_into(self._landmarks_buf, HEADER.size, *flat)
+        self._send(self._landmarks_buf)
+
+    def close(self):
+        try:
+            self.sock.close()
+        finally:
+            if os.path.exists(self.path):
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+
+
+class EventSubscriber:
+    """
+    Subscriber bound to its own temporary socket. recv() re-sends the
+    subscription periodically so it survives publisher restarts.
+    """
+    def __init__(self, path: str = DEFAULT_PATH, recv_buffer: int = 1 << 20, resubscribe_interval: float = 1.0):
+        self.publisher_path = path
+        self.resubscribe_interval = resubscribe_interval
+        self.path = os.path.join(tempfile.gettempdir(), f'hand-gesture-sub-{os.getpid()}-{id(self):x}.sock')
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer)
+        self.sock.bind(self.path)
+        self._last_subscribe = 0.0
+        self.subscribe()
+
+    def subscribe(self):
+        self._last_subscribe = time.monotonic()
+        try:
+            self.sock.sendto(_SUBSCRIBE, self.publisher_path)
+            return True
+        except OSError:
+            return False  # publisher not running yet; retried from recv()
+
+    def recv(self, timeout: Optional[float] = None):
+        """Wait for the next event; returns None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if time.monotonic() - self._last_subscribe > self.resubscribe_interval:
+                self.subscribe()
+            wait = self.resubscribe_interval
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            self.sock.settimeout(wait)
+            try:
+                data = self.sock.recv(LANDMARKS_SIZE)
+            except (socket.timeout, BlockingIOError):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+                continue
+            event = decode(data)
+            if event is not None:
+                return event
+
+    def close(self):
+        try:
+            self.sock.sendto(_UNSUBSCRIBE, self.publisher_path)
+        except OSError:
+            pass
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
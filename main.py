@@ -1,94 +1,114 @@
-import gradio as gr
-import threading
-from config import Config, save_config
+import argparse
+from config import Config
 import app
+import control
 
-controller_thread = None
+try:
+    import gradio as gr
+except ImportError:
+    gr = None
 
 
-def update_config(pause, smoothing_factor, min_movement_threshold, sensitivity, target_fps, failsafe, invert_hands):
+def update_config(pause, smoothing_factor, min_movement_threshold, sensitivity, target_fps, failsafe, invert_hands,
+                  governor_enabled, target_latency_ms):
     """Update configuration parameters from the Gradio UI and persist them."""
-    cfg = {
+    cfg = control.apply_config({
         "PAUSE": pause,
-        "SMOOTHING_FACTOR": max(0.0, min(float(smoothing_factor), 1.0)),
+        "SMOOTHING_FACTOR": smoothing_factor,
         "MIN_MOVEMENT_THRESHOLD": min_movement_threshold,
         "SENSITIVITY": sensitivity,
-        "TARGET_FPS": int(target_fps),
-    "FAILSAFE": bool(failsafe),
-    "INVERT_HANDS": bool(invert_hands),
-    }
-    Config.update_from_dict(cfg)
-    save_config(cfg)
+        "TARGET_FPS": target_fps,
+        "FAILSAFE": failsafe,
+        "INVERT_HANDS": invert_hands,
+        "GOVERNOR_ENABLED": governor_enabled,
+        "TARGET_LATENCY_MS": target_latency_ms,
+    })
     msg = (
         f"Config updated and saved!\n"
-        f"PAUSE={pause}\nSMOOTHING_FACTOR={cfg['SMOOTHING_FACTOR']}\n"
-        f"MIN_MOVEMENT_THRESHOLD={min_movement_threshold}\nSENSITIVITY={sensitivity}\nTARGET_FPS={int(target_fps)}\n"
-    f"FAILSAFE={cfg['FAILSAFE']}\n"
-    f"INVERT_HANDS={cfg['INVERT_HANDS']}\n"
+        f"PAUSE={cfg['PAUSE']}\nSMOOTHING_FACTOR={cfg['SMOOTHING_FACTOR']}\n"
+        f"MIN_MOVEMENT_THRESHOLD={cfg['MIN_MOVEMENT_THRESHOLD']}\nSENSITIVITY={cfg['SENSITIVITY']}\nTARGET_FPS={cfg['TARGET_FPS']}\n"
+        f"FAILSAFE={cfg['FAILSAFE']}\n"
+        f"INVERT_HANDS={cfg['INVERT_HANDS']}\n"
+        f"GOVERNOR_ENABLED={cfg['GOVERNOR_ENABLED']}\n"
+        f"TARGET_LATENCY_MS={cfg['TARGET_LATENCY_MS']}\n"
     )
     print(msg)
     return msg
 
-def start_controller():
-    """
-    Start the hand gesture controller in a background thread.
-    """
-    global controller_thread
-    with Config.lock:
-        if Config.running:
-            return "Controller already running."
-        Config.running = True
-    def run_app():
-        try:
-            app.main()
-        except Exception as e:
-            print(f"Controller stopped: {e}")
-            with Config.lock:
-                Config.running = False
-    controller_thread = threading.Thread(target=run_app, daemon=True)
-    controller_thread.start()
-    return "Controller started!"
+def get_governor_status():
+    running_app = app.active_app
+    if running_app is None:
+        return "Governor idle (controller not running)"
+    if not getattr(Config, 'GOVERNOR_ENABLED', False):
+        return "Governor disabled\n" + running_app.governor.status_text()
+    return running_app.governor.status_text()
+
+def build_ui():
+    """Build the Gradio Blocks UI (requires gradio)."""
+    with gr.Blocks() as demo:
+        gr.Markdown("# Cursor Controller Config & Launcher")
+        status = gr.Textbox(label="Controller Status", value=control.get_status(), interactive=False)
+        with gr.Row():
+            pause = gr.Slider(0.0001, 0.01, value=Config.PAUSE, label="PAUSE (pyautogui pause)", step=0.00001)
+        smoothing_factor = gr.Slider(0.0, 1.0, value=Config.SMOOTHING_FACTOR, label="SMOOTHING_FACTOR (alpha 0–1)", step=0.01)
+        with gr.Row():
+            min_movement_threshold = gr.Slider(0, 100, value=Config.MIN_MOVEMENT_THRESHOLD, label="MIN_MOVEMENT_THRESHOLD (dead zone)", step=1)
+            sensitivity = gr.Slider(0.1, 50.0, value=Config.SENSITIVITY, label="SENSITIVITY (speed multiplier)", step=0.05)
+            target_fps = gr.Slider(5, 60, value=Config.TARGET_FPS, label="TARGET_FPS (camera pacing)", step=1)
+        failsafe = gr.Checkbox(value=getattr(Config, 'FAILSAFE', True), label="Enable PyAutoGUI FAILSAFE (corner abort)")
+        invert_hands = gr.Checkbox(value=getattr(Config, 'INVERT_HANDS', False), label="Invert hands (left=move, right=clicks)")
+        with gr.Row():
+            governor_enabled = gr.Checkbox(value=getattr(Config, 'GOVERNOR_ENABLED', True), label="Performance governor (auto FPS/resolution/model)")
+            target_latency_ms = gr.Slider(10, 200, value=getattr(Config, 'TARGET_LATENCY_MS', 40), label="TARGET_LATENCY_MS (governor budget)", step=1)
+        update_btn = gr.Button("Update Config")
+        start_btn = gr.Button("Start Controller")
+        stop_btn = gr.Button("Stop Controller")
+        reset_btn = gr.Button("Reset Smoothing")
+        output = gr.Textbox(label="Status")
+        governor_status = gr.Textbox(label="Governor", value=get_governor_status(), interactive=False, lines=8)
+        governor_btn = gr.Button("Refresh Governor Status")
+        update_btn.click(fn=update_config, inputs=[pause, smoothing_factor, min_movement_threshold, sensitivity, target_fps, failsafe, invert_hands, governor_enabled, target_latency_ms], outputs=output)
+        start_btn.click(fn=control.start_controller, outputs=output)
+        stop_btn.click(fn=control.stop_controller, outputs=output)
+        reset_btn.click(fn=control.reset_smoothing, outputs=output)
+        governor_btn.click(fn=get_governor_status, outputs=governor_status)
+    return demo
 
-def stop_controller():
+def main():
     """
-    Stop the controller by setting the running flag to False.
+    Start the local control API and, if gradio is installed, the Gradio UI.
+    Without gradio (or with --no-gradio) the API is the only control surface.
     """
-    with Config.lock:
-        Config.running = False
-    return "Controller stopping... (may take a moment)"
+    parser = argparse.ArgumentParser(description="Hand gesture cursor controller")
+    parser.add_argument("--no-gradio", action="store_true", help="do not launch the Gradio UI")
+    parser.add_argument("--no-api", action="store_true", help="do not start the local HTTP/WebSocket API")
+    parser.add_argument("--api-host", default=getattr(Config, 'API_HOST', "127.0.0.1"))
+    parser.add_argument("--api-port", type=int, default=getattr(Config, 'API_PORT', 8765))
+    args = parser.parse_args()
 
-def get_status():
-    with Config.lock:
-        if Config.running:
-            return "Controller is RUNNING"
-        else:
-            return "Controller is STOPPED"
-
-def reset_smoothing():
-    from controller import Controller
-    Controller.reset_smoothing()
-    return "Smoothing reset!"
+    server = None
+    if getattr(Config, 'API_ENABLED', True) and not args.no_api:
+        from api.http_server import ControlServer
+        try:
+            server = ControlServer(args.api_host, args.api_port).start()
+        except OSError as e:
+            print(f"Warning: control API not started on {args.api_host}:{args.api_port}: {e}")
 
-with gr.Blocks() as demo:
-    gr.Markdown("# Cursor Controller Config & Launcher")
-    status = gr.Textbox(label="Controller Status", value=get_status(), interactive=False)
-    with gr.Row():
-        pause = gr.Slider(0.0001, 0.01, value=Config.PAUSE, label="PAUSE (pyautogui pause)", step=0.00001)
-    smoothing_factor = gr.Slider(0.0, 1.0, value=Config.SMOOTHING_FACTOR, label="SMOOTHING_FACTOR (alpha 0–1)", step=0.01)
-    with gr.Row():
-        min_movement_threshold = gr.Slider(0, 100, value=Config.MIN_MOVEMENT_THRESHOLD, label="MIN_MOVEMENT_THRESHOLD (dead zone)", step=1)
-        sensitivity = gr.Slider(0.1, 50.0, value=Config.SENSITIVITY, label="SENSITIVITY (speed multiplier)", step=0.05)
-        target_fps = gr.Slider(5, 60, value=Config.TARGET_FPS, label="TARGET_FPS (camera pacing)", step=1)
-    failsafe = gr.Checkbox(value=getattr(Config, 'FAILSAFE', True), label="Enable PyAutoGUI FAILSAFE (corner abort)")
-    invert_hands = gr.Checkbox(value=getattr(Config, 'INVERT_HANDS', False), label="Invert hands (left=move, right=clicks)")
-    update_btn = gr.Button("Update Config")
-    start_btn = gr.Button("Start Controller")
-    stop_btn = gr.Button("Stop Controller")
-    reset_btn = gr.Button("Reset Smoothing")
-    output = gr.Textbox(label="Status")
-    update_btn.click(fn=update_config, inputs=[pause, smoothing_factor, min_movement_threshold, sensitivity, target_fps, failsafe, invert_hands], outputs=output)
-    start_btn.click(fn=start_controller, outputs=output)
-    stop_btn.click(fn=stop_controller, outputs=output)
-    reset_btn.click(fn=reset_smoothing, outputs=output)
+    if gr is not None and not args.no_gradio:
+        build_ui().launch()
+    elif server is not None:
+        if gr is None:
+            print("gradio not installed; use the control API (POST /start, /stop, /config; GET /metrics, /ws)")
+        try:
+            server.join()
+        except KeyboardInterrupt:
+            control.stop_controller()
+            server.stop()
+    else:
+        print("No control surface enabled; starting controller directly")
+        control.start_controller()
+        if control.controller_thread is not None:
+            control.controller_thread.join()
 
-demo.launch()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Server mode: run many independent video sources (device indices, device paths
+or video files) on a fixed pool of inference workers.
+
+- Each stream has its own capture thread and a one-frame mailbox; a newer frame
+  replaces an unprocessed one, so a slow stream never builds a backlog.
+- Each stream owns one detector in tracking mode (static_image_mode=False).
+  Workers hold no detector: they always serve the ready stream that was served
+  least recently (fair round-robin) and run that stream's detector. A stream is
+  only ever processed by one worker at a time, so its detector and gesture
+  state see its frames in order.
+- Each stream keeps its own gesture state (utils.gesture_state.GestureState,
+  the same state machine the desktop Controller runs). Gestures are
+  published on the event bus with the stream id as `source`; the server
+  never moves the local OS cursor.
+- A load monitor sheds the most expensive streams first when the pool is
+  overloaded (processing only every 2nd, 4th, ... frame) and restores them
+  when there is headroom again.
+
+    python -m streams.multi_stream --source 0 --source /dev/video2 --source kiosk.mp4 --workers 2
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from collections import deque
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+from config import Config
+from video.capture_manager import CaptureManager
+from detection.hand_detector import create_detector, assign_hands
+from utils.fps_meter import FPSMeter
+from utils.gesture_state import GestureState
+from utils.telemetry import telemetry
+from events.event_bus import EventPublisher, Hand
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class Stream:
+    """
+    One video source with its capture thread, mailbox, gesture state and
+    metrics. `source` is a device index/path, a video file, or any object with
+    read() -> (ok, frame) and release().
+    """
+    def __init__(self, stream_id, source, width=640, height=480, target_fps=15, latency_window=120):
+        self.id = stream_id
+        self.name = str(source) if not hasattr(source, 'read') else type(source).__name__
+        self.capture = source if hasattr(source, 'read') else CaptureManager(source, width, height, target_fps)
+        self.state = GestureState()
+        self.detector = None  # set by MultiStreamServer.start()
+        # Mailbox and scheduling fields, guarded by the server's condition
+        self.pending = None  # (frame, capture_time, frame_number)
+        self.busy = False
+        self.finished = False
+        self.last_served = 0.0
+        self.shed_level = 0
+        # Metrics
+        self.frames_in = 0
+        self.dropped = 0
+        self.shed = 0
+        self.processed = 0
+        self.cost_ema = 0.0
+        self.latencies = deque(maxlen=latency_window)
+        self.fps_meter = FPSMeter(window=30, ema_alpha=0.9)
+        self.input_fps_meter = FPSMeter(window=30, ema_alpha=0.9)
+        # Frame timestamps are capture times (perf_counter) relative to this origin
+        self.origin = time.perf_counter()
+
+    def metrics(self):
+        latencies = list(self.latencies)
+        return {
+            "id": self.id,
+            "source": self.name,
+            "fps": round(self.fps_meter.smoothed_fps, 1),
+            "input_fps": round(self.input_fps_meter.smoothed_fps, 1),
+            "latency_p50_ms": round(1000 * _percentile(latencies, 0.5), 1),
+            "latency_p95_ms": round(1000 * _percentile(latencies, 0.95), 1),
+            "cost_ms": round(1000 * self.cost_ema, 1),
+            "frames_in": self.frames_in,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "shed": self.shed,
+            "shed_level": self.shed_level,
+            "finished": self.finished,
+        }
+
+
+class MultiStreamServer:
+    """
+    Runs N streams on `workers` inference threads. Every stream gets its own
+    detector so cross-frame tracking stays on (palm detection only runs when
+    tracking is lost); the cost is one model instance per stream, while the
+    worker count still bounds how many run at once.
+    """
+    def __init__(self, sources, workers=2, backend="solutions", width=640, height=480, target_fps=15,
+                 max_latency_ms=150.0, max_shed_level=3, monitor_interval=1.0, event_bus=None,
+                 publish_landmarks=False, detector_kwargs=None):
+        self.streams = [Stream(i + 1, src, width, height, target_fps) for i, src in enumerate(sources)]
+        self.num_workers = max(1, int(workers))
+        self.backend = backend
+        self.detector_kwargs = dict(detector_kwargs or {})
+        self.max_latency = max_latency_ms / 1000.0
+        self.max_shed_level = max_shed_level
+        self.monitor_interval = monitor_interval
+        self.event_bus = event_bus
+        self.publish_landmarks = publish_landmarks
+        self.decisions = deque(maxlen=50)
+        self.load = 0.0
+        self._cond = threading.Condition()
+        self._bus_lock = threading.Lock()
+        self._running = False
+        self._threads = []
+        self._over = 0
+        self._under = 0
+
+    # --- lifecycle ----------------------------------------------------------
+
+    def start(self):
+        # Build detectors up front so configuration errors surface here, not in a thread
+        try:
+            for stream in self.streams:
+                stream.detector = create_detector(self.backend, **self.detector_kwargs)
+                if stream.detector.is_async:
+                    raise ValueError(f"Server mode needs a synchronous detector backend, not '{self.backend}'")
+        except Exception:
+            self._close_detectors()
+            raise
+        self._running = True
+        for stream in self.streams:
+            self._spawn(self._capture_loop, stream, name=f"capture-{stream.id}")
+        for i in range(self.num_workers):
+            self._spawn(self._worker_loop, name=f"worker-{i}")
+        self._spawn(self._monitor_loop, name="load-monitor")
+        print(f"Serving {len(self.streams)} streams on {self.num_workers} {self.backend} workers")
+        return self
+
+    def _spawn(self, target, *args, name=None):
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+        for stream in self.streams:
+            try:
+                stream.capture.release()
+            except Exception:
+                pass
+        self._close_detectors()
+
+    def _close_detectors(self):
+        for stream in self.streams:
+            if stream.detector is not None:
+                stream.detector.close()
+                stream.detector = None
+
+    @property
+    def running(self):
+        return self._running and not all(s.finished for s in self.streams)
+
+    # --- capture ------------------------------------------------------------
+
+    def _capture_loop(self, stream):
+        while self._running:
+            ok, frame = stream.capture.read()
+            if not ok:
+                with self._cond:
+                    stream.finished = True
+                print(f"Stream {stream.id} ({stream.name}) ended")
+                return
+            stream.frames_in += 1
+            stream.input_fps_meter.tick()
+            level = stream.shed_level
+            if level and stream.frames_in % (1 << level):
+                stream.shed += 1
+                continue
+            with self._cond:
+                if stream.pending is not None:
+                    stream.dropped += 1
+                stream.pending = (frame, time.perf_counter(), stream.frames_in)
+                self._cond.notify()
+
+    # --- inference ----------------------------------------------------------
+
+    def _next_job(self):
+        """Wait for a ready stream; pick the one served least recently."""
+        with self._cond:
+            while self._running:
+                ready = [s for s in self.streams if s.pending is not None and not s.busy]
+                if ready:
+                    stream = min(ready, key=lambda s: s.last_served)
+                    job = stream.pending
+                    stream.pending = None
+                    stream.busy = True
+                    stream.last_served = time.perf_counter()
+                    return stream, job
+                self._cond.wait(0.5)
+        return None, None
+
+    def _worker_loop(self):
+        while True:
+            stream, job = self._next_job()
+            if stream is None:
+                return
+            frame, captured, _ = job
+            try:
+                self._process(stream, frame, captured)
+            except Exception as e:
+                print(f"Stream {stream.id} processing error: {e}")
+            finally:
+                with self._cond:
+                    stream.busy = False
+                    self._cond.notify()
+
+    def _process(self, stream, frame, captured):
+        start = time.perf_counter()
+        img_rgb = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+        # Capture time, not pickup time: queueing delay must not distort velocities
+        timestamp = captured - stream.origin
+        result = stream.detector.detect(img_rgb, int(timestamp * 1000))
+        right_hand, left_hand = assign_hands(result.hands, getattr(Config, 'INVERT_HANDS', False))
+        events = stream.state.update(right_hand, left_hand, timestamp, getattr(Config, 'MOTION_GESTURES', True))
+        if self.event_bus is not None and (events or self.publish_landmarks):
+            with self._bus_lock:
+                for gesture, hand, value in events:
+                    self.event_bus.publish_gesture(gesture, hand, value, source=stream.id)
+                if self.publish_landmarks:
+                    if right_hand is not None:
+                        self.event_bus.publish_landmarks(right_hand, Hand.RIGHT, source=stream.id)
+                    if left_hand is not None:
+                        self.event_bus.publish_landmarks(left_hand, Hand.LEFT, source=stream.id)
+        done = time.perf_counter()
+        cost = done - start
+        # Only this worker touches the stream's metrics while it is busy
+        stream.cost_ema = cost if stream.cost_ema == 0.0 else 0.8 * stream.cost_ema + 0.2 * cost
+        stream.latencies.append(done - captured)
+        stream.processed += 1
+        stream.fps_meter.tick()
+
+    # --- load shedding --------------------------------------------------------
+
+    def _monitor_loop(self):
+        while self._running:
+            time.sleep(self.monitor_interval)
+            self.rebalance()
+            telemetry.publish(self.metrics())
+
+    def rebalance(self):
+        """
+        Estimate pool load as the worker time demanded per second (input rate
+        after shedding x per-frame cost) over the worker count. Shed the most
+        expensive stream after two overloaded intervals; restore the cheapest
+        shed stream after five intervals with headroom.
+        """
+        active = [s for s in self.streams if not s.finished]
+        if not active:
+            return
+        demand = sum(s.input_fps_meter.smoothed_fps / (1 << s.shed_level) * s.cost_ema for s in active)
+        self.load = demand / self.num_workers
+        worst = max(_percentile(list(s.latencies), 0.9) for s in active)
+        if self.load > 0.9 or worst > self.max_latency:
+            self._over += 1
+            self._under = 0
+        elif self.load < 0.6 and worst < 0.5 * self.max_latency:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= 2:
+            candidates = [s for s in active if s.shed_level < self.max_shed_level]
+            if candidates:
+                stream = max(candidates, key=lambda s: s.cost_ema)
+                stream.shed_level += 1
+                self._log(f"shed stream {stream.id} ({stream.cost_ema * 1000:.1f}ms/frame) to 1/{1 << stream.shed_level} "
+                          f"frames: load {self.load:.2f}, p90 {worst * 1000:.0f}ms")
+            self._over = 0
+        elif self._under >= 5:
+            shed = [s for s in active if s.shed_level > 0]
+            if shed:
+                stream = min(shed, key=lambda s: s.cost_ema)
+                stream.shed_level -= 1
+                self._log(f"restore stream {stream.id} to 1/{1 << stream.shed_level} frames: load {self.load:.2f}")
+            self._under = 0
+
+    def _log(self, message):
+        stamp = time.strftime("%H:%M:%S")
+        self.decisions.append(f"[{stamp}] {message}")
+        print(f"Load monitor: {message}")
+
+    # --- metrics --------------------------------------------------------------
+
+    def metrics(self):
+        streams = [s.metrics() for s in self.streams]
+        return {
+            "workers": self.num_workers,
+            "load": round(self.load, 3),
+            "aggregate_fps": round(sum(s["fps"] for s in streams), 1),
+            "streams": streams,
+            "decisions": list(self.decisions)[-10:],
+        }
+
+    def report(self):
+        m = self.metrics()
+        lines = [f"aggregate {m['aggregate_fps']:.1f} fps, load {m['load']:.2f}",
+                 f"{'id':>3} {'fps':>6} {'in fps':>6} {'p50 ms':>7} {'p95 ms':>7} {'cost':>6} "
+                 f"{'drop':>6} {'shed':>6} {'lvl':>3}  source"]
+        for s in m["streams"]:
+            lines.append(f"{s['id']:>3} {s['fps']:>6.1f} {s['input_fps']:>6.1f} {s['latency_p50_ms']:>7.1f} "
+                         f"{s['latency_p95_ms']:>7.1f} {s['cost_ms']:>6.1f} {s['dropped']:>6} {s['shed']:>6} "
+                         f"{s['shed_level']:>3}  {s['source']}")
+        return "\n".join(lines)
+
+
+def parse_source(spec):
+    """'0' -> camera index 0; anything else is a device path or video file."""
+    return int(spec) if spec.isdigit() else spec
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several video sources on a shared pool of inference workers")
+    parser.add_argument("--source", action="append", required=True, help="camera index, device path or video file (repeatable)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--backend", default=getattr(Config, 'DETECTOR_BACKEND', 'solutions'))
+    parser.add_argument("--fps", type=float, default=15)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--model-complexity", type=int, default=0)
+    parser.add_argument("--max-latency-ms", type=float, default=150.0)
+    parser.add_argument("--event-bus", nargs="?", const="", default=None,
+                        help="publish gestures on the event bus (optional socket path)")
+    parser.add_argument("--landmarks", action="store_true", help="also publish landmarks on the event bus")
+    parser.add_argument("--report-interval", type=float, default=5.0)
+    args = parser.parse_args()
+
+    bus = None
+    if args.event_bus is not None:
+        path = args.event_bus or getattr(Config, 'EVENT_BUS_PATH', '') or None
+        bus = EventPublisher(path) if path else EventPublisher()
+        print(f"Publishing gesture events on {bus.path}")
+
+    server = MultiStreamServer(
+        [parse_source(s) for s in args.source], workers=args.workers, backend=args.backend,
+        width=args.width, height=args.height, target_fps=args.fps, max_latency_ms=args.max_latency_ms,
+        event_bus=bus, publish_landmarks=args.landmarks,
+        detector_kwargs={"model_complexity": args.model_complexity},
+    ).start()
+    try:
+        while server.running:
+            time.sleep(args.report_interval)
+            print(server.report())
+    except KeyboardInterrupt:
+        print("\nStopping server...")
+    finally:
+        server.stop()
+        if bus is not None:
+            bus.close()
+        print(server.report())
+
+
+if __name__ == "__main__":
+    main()
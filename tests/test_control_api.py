@@ -0,0 +1,215 @@
+import os
+import json
+import asyncio
+import socket
+import struct
+
+import pytest
+
+import control
+from config import Config
+from utils.telemetry import telemetry
+from api.http_server import ControlServer, is_local_origin
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setattr("config.CONFIG_PATH", str(tmp_path / "config.json"))
+    monkeypatch.setattr(Config, "SENSITIVITY", Config.SENSITIVITY)
+    monkeypatch.setattr(Config, "running", False)
+    srv = ControlServer(port=0, push_interval=0.01).start()
+    yield srv
+    srv.stop()
+
+
+def request(server, raw):
+    """Send a raw request and return (status, decoded JSON body)."""
+    with socket.create_connection(("127.0.0.1", server.port), timeout=2) as sock:
+        sock.sendall(raw.encode("latin-1"))
+        data = b""
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), json.loads(body) if body else None
+
+
+def get(server, path):
+    return request(server, f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n")
+
+
+def post(server, path, payload, content_type="application/json"):
+    body = json.dumps(payload)
+    return request(server, f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: {content_type}\r\n"
+                           f"Content-Length: {len(body)}\r\n\r\n{body}")
+
+
+class WebSocket:
+    """Minimal test client: masked text frames out, unmasked frames in."""
+    def __init__(self, server, origin="http://localhost:5173"):
+        self.sock = socket.create_connection(("127.0.0.1", server.port), timeout=2)
+        self.sock.sendall(("GET /ws HTTP/1.1\r\nHost: 127.0.0.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                           f"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nOrigin: {origin}\r\n\r\n").encode("latin-1"))
+        head = b""
+        while b"\r\n\r\n" not in head:
+            head += self.sock.recv(1)
+        self.status = int(head.split(b" ", 2)[1])
+
+    def _read(self, n):
+        data = b""
+        while len(data) < n:
+            chunk = self.sock.recv(n - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def send(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        mask = os.urandom(4)
+        assert len(data) < 126
+        self.sock.sendall(struct.pack("!BB", 0x81, 0x80 | len(data)) + mask
+                          + bytes(b ^ mask[i % 4] for i, b in enumerate(data)))
+
+    def recv(self):
+        b0, b1 = self._read(2)
+        length = b1 & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", self._read(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", self._read(8))
+        return json.loads(self._read(length))
+
+    def recv_until(self, predicate, limit=50):
+        for _ in range(limit):
+            message = self.recv()
+            if predicate(message):
+                return message
+        raise AssertionError("expected message not received")
+
+    def close(self):
+        self.sock.close()
+
+
+@pytest.mark.parametrize("origin, allowed", [
+    (None, True),
+    ("http://localhost:3000", True),
+    ("http://127.0.0.1", True),
+    ("http://[::1]:8080", True),
+    ("https://evil.example", False),
+    ("http://localhost.evil.example", False),
+    ("null", False),
+])
+def test_local_origin(origin, allowed):
+    assert is_local_origin(origin) is allowed
+
+
+@pytest.mark.parametrize("value, expected", [(True, True), (False, False), ("false", False),
+                                             ("True", True), ("0", False), ("1", True)])
+def test_parse_bool(value, expected):
+    assert control._parse_bool(value) is expected
+
+
+@pytest.mark.parametrize("cfg", [{"GOVERNOR_ENABLED": "no way"}, {"FAILSAFE": 2},
+                                 {"DETECTOR_BACKEND": "opencv"}, {"NOT_A_KEY": 1},
+                                 {"TARGET_FPS": -5}, {"PAUSE": -1}, {"HISTORY_SIZE": 0},
+                                 {"SCROLL_SPEED": float("nan")}, {"ZOOM_SPEED": float("inf")},
+                                 {"TARGET_FPS": 30.5}, {"SENSITIVITY": True}, {"SMOOTHING_FACTOR": 1.5}])
+def test_apply_config_rejects_invalid_values(cfg):
+    with pytest.raises(ValueError):
+        control.apply_config(cfg)
+
+
+def test_status_and_metrics(server):
+    telemetry.publish({"fps": 29.5, "stage_ms": {"inference": 12.0}})
+    status, body = get(server, "/status")
+    assert status == 200
+    assert body["running"] is False
+    assert body["telemetry"]["fps"] == 29.5
+    status, body = get(server, "/metrics")
+    assert status == 200 and body["stage_ms"] == {"inference": 12.0}
+
+
+def test_get_and_post_config(server):
+    status, body = get(server, "/config")
+    assert status == 200 and set(body) == set(control.CONFIG_TYPES)
+    status, body = post(server, "/config", {"SENSITIVITY": 0.5})
+    assert status == 200 and body == {"applied": {"SENSITIVITY": 0.5}}
+    assert get(server, "/config")[1]["SENSITIVITY"] == 0.5
+    assert post(server, "/config", {"SENSITIVITY": "fast"})[0] == 400
+    # json.dumps writes NaN, which json.loads on the server accepts
+    status, body = post(server, "/config", {"TARGET_FPS": 30, "SCROLL_SPEED": float("nan")})
+    assert status == 400 and "SCROLL_SPEED" in body["error"]
+    assert get(server, "/config")[1]["TARGET_FPS"] == Config.TARGET_FPS
+
+
+def test_apply_config_accepts_slider_values(monkeypatch, tmp_path):
+    monkeypatch.setattr("config.CONFIG_PATH", str(tmp_path / "config.json"))
+    for key in ("TARGET_FPS", "PAUSE"):
+        monkeypatch.setattr(Config, key, getattr(Config, key))
+    assert control.apply_config({"TARGET_FPS": 60.0, "PAUSE": "0.005"}) == {"TARGET_FPS": 60, "PAUSE": 0.005}
+    assert json.load(open(tmp_path / "config.json")) == {"TARGET_FPS": 60, "PAUSE": 0.005}
+
+
+def test_routing_errors(server):
+    assert get(server, "/nope")[0] == 404
+    assert get(server, "/start")[0] == 405
+    assert post(server, "/status", {})[0] == 405
+
+
+def test_post_requires_json_content_type(server):
+    assert post(server, "/config", {"SENSITIVITY": 0.5}, "text/plain")[0] == 415
+    assert post(server, "/config", {"SENSITIVITY": 0.5}, "application/json; charset=utf-8")[0] == 200
+
+
+def test_cross_origin_requests_rejected(server):
+    status, _ = request(server, "GET /status HTTP/1.1\r\nHost: 127.0.0.1\r\nOrigin: https://evil.example\r\n\r\n")
+    assert status == 403
+    ws = WebSocket(server, origin="https://evil.example")
+    assert ws.status == 403
+    ws.close()
+
+
+def test_websocket_pushes_telemetry(server):
+    ws = WebSocket(server)
+    try:
+        assert ws.status == 101
+        ws.recv()  # current snapshot on connect
+        telemetry.publish({"fps": 42.0})
+        message = ws.recv_until(lambda m: m.get("fps") == 42.0)
+        assert message["running"] is False and message["seq"] == telemetry.read()["seq"]
+    finally:
+        ws.close()
+
+
+def test_websocket_commands(server):
+    ws = WebSocket(server)
+    try:
+        ws.send({"action": "config", "config": {"SENSITIVITY": 0.75}})
+        assert ws.recv_until(lambda m: "applied" in m) == {"applied": {"SENSITIVITY": 0.75}}
+        assert Config.SENSITIVITY == 0.75
+        ws.send({"action": "config", "config": {"DETECTOR_BACKEND": "opencv"}})
+        assert "opencv" in ws.recv_until(lambda m: "error" in m)["error"]
+        ws.send({"action": "stop"})
+        assert "stopping" in ws.recv_until(lambda m: "message" in m)["message"]
+        ws.send({"action": "dance"})
+        assert ws.recv_until(lambda m: "error" in m) == {"error": "unknown action: dance"}
+    finally:
+        ws.close()
+
+
+def test_stop_finishes_open_connections():
+    srv = ControlServer(port=0, push_interval=0.01).start()
+    ws = WebSocket(srv)
+    ws.recv()
+    half_open = socket.create_connection(("127.0.0.1", srv.port))
+    half_open.sendall(b"GET /status HTTP/1.1\r\n")
+    try:
+        srv.stop()
+        assert srv.loop.is_closed()
+        assert not asyncio.all_tasks(srv.loop)
+    finally:
+        ws.close()
+        half_open.close()
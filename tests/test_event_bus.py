@@ -0,0 +1,56 @@
+import socket
+
+import pytest
+
+from events.event_bus import EventPublisher, EventSubscriber, Gesture, Hand, GestureEvent
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "events.sock")
+
+
+def test_gesture_roundtrip(path):
+    publisher = EventPublisher(path, poll_interval=0)
+    subscriber = EventSubscriber(path)
+    try:
+        assert publisher.wait_for_subscribers(1, timeout=2.0)
+        publisher.publish_gesture(Gesture.SCROLL, Hand.RIGHT, 3.0, source=7)
+        event = subscriber.recv(timeout=2.0)
+        assert isinstance(event, GestureEvent)
+        assert (event.gesture, event.hand, event.source, event.x) == (Gesture.SCROLL, Hand.RIGHT, 7, 3.0)
+    finally:
+        subscriber.close()
+        publisher.close()
+
+
+def test_second_publisher_on_live_path_fails(path):
+    first = EventPublisher(path)
+    try:
+        with pytest.raises(OSError, match="already bound"):
+            EventPublisher(path)
+        # the live publisher keeps its socket
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        probe.connect(path)
+        probe.close()
+    finally:
+        first.close()
+
+
+def test_stale_socket_is_replaced(path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stale.bind(path)
+    stale.close()  # socket file remains, nobody bound
+    publisher = EventPublisher(path)
+    publisher.close()
+
+
+def test_refuses_to_unlink_regular_file(path):
+    with open(path, "w") as f:
+        f.write("not a socket")
+    with pytest.raises(FileExistsError):
+        EventPublisher(path)
+    with open(path) as f:
+        assert f.read() == "not a socket"
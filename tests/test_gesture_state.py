@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from config import Config
+from detection.hand_detector import HandLandmarks, Landmark, NUM_LANDMARKS
+from events.event_bus import Gesture, Hand
+from utils.gesture_state import GestureState, GestureAction
+
+UP, DOWN = True, False
+DT = 1 / 30
+
+
+@pytest.fixture(autouse=True)
+def motion_config(monkeypatch):
+    for key, value in {"SCROLL_SPEED": 20, "SCROLL_DEADZONE": 0.2, "ZOOM_SPEED": 10,
+                       "ZOOM_DEADZONE": 0.5, "ZOOM_MIN_PINCH": 0.08}.items():
+        monkeypatch.setattr(Config, key, value)
+
+
+def make_hand(index=UP, middle=UP, ring=UP, little=UP, thumb_down=False, pinch=False,
+              middle_pinch=False, spread=None, dy=0.0):
+    """Hand in a given pose. Thumb tip at (0.2, 0.4); `spread` places the index tip that far from it."""
+    pts = [Landmark(0.5, 0.8 + dy)] * NUM_LANDMARKS
+    for mcp, tip, x, up in ((5, 8, 0.4, index), (9, 12, 0.5, middle), (13, 16, 0.6, ring), (17, 20, 0.7, little)):
+        pts[mcp] = Landmark(x, 0.5 + dy)
+        pts[tip] = Landmark(x, (0.3 if up else 0.6) + dy)
+    pts[3] = Landmark(0.2, (0.35 if thumb_down else 0.45) + dy)
+    pts[4] = Landmark(0.2, 0.4 + dy)
+    if pinch:
+        pts[8] = Landmark(0.21, 0.4 + dy)
+    elif spread is not None:
+        pts[8] = Landmark(0.2 + spread, 0.4 + dy)
+    if middle_pinch:
+        pts[12] = Landmark(0.2, 0.41 + dy)
+    return HandLandmarks(tuple(pts))
+
+
+def gestures(actions):
+    return [a.gesture for a in actions]
+
+
+def run(state, frames, t0=0.0):
+    """Feed (right, left) pairs at 30 FPS; return all actions."""
+    actions = []
+    for i, (right, left) in enumerate(frames):
+        actions.extend(state.update(right, left, t0 + i * DT))
+    return actions
+
+
+OPEN = make_hand()
+PINCH = make_hand(pinch=True)
+FREEZE = make_hand(pinch=True, thumb_down=True)
+
+
+def test_pinch_freeze_unfreeze():
+    state = GestureState()
+    actions = run(state, [(OPEN, None), (PINCH, None), (FREEZE, None), (PINCH, None)])
+    assert gestures(actions) == [Gesture.MOVE_START, Gesture.FREEZE_START, Gesture.FREEZE_END]
+    assert state.moving
+
+
+def test_unpinch_while_frozen_ends_both():
+    state = GestureState()
+    actions = run(state, [(PINCH, None), (FREEZE, None), (OPEN, None)])
+    assert gestures(actions) == [Gesture.MOVE_START, Gesture.FREEZE_START, Gesture.MOVE_END, Gesture.FREEZE_END]
+
+
+def test_losing_only_the_movement_hand_ends_nothing():
+    state = GestureState()
+    assert gestures(run(state, [(PINCH, OPEN)])) == [Gesture.MOVE_START]
+    assert state.update(None, OPEN, 1.0) == []
+    assert state.move_active
+
+
+def test_hand_lost_closes_everything_once():
+    state = GestureState()
+    run(state, [(PINCH, make_hand(pinch=True)), (FREEZE, make_hand(pinch=True))])
+    assert gestures(state.update(None, None, 1.0)) == [
+        Gesture.MOVE_END, Gesture.FREEZE_END, Gesture.LEFT_HOLD_END, Gesture.HAND_LOST]
+    assert state.update(None, None, 1.1) == []
+    assert not (state.move_active or state.frozen or state.left_hold)
+
+
+def test_click_hand_hold_and_right_click_edges():
+    state = GestureState()
+    left_pinch = make_hand(pinch=True)
+    middle = make_hand(middle_pinch=True)
+    actions = run(state, [(None, OPEN), (None, left_pinch), (None, left_pinch), (None, OPEN),
+                          (None, middle), (None, middle), (None, OPEN), (None, middle)])
+    assert actions == [GestureAction(Gesture.LEFT_HOLD_START, Hand.LEFT), GestureAction(Gesture.LEFT_HOLD_END, Hand.LEFT),
+                       GestureAction(Gesture.RIGHT_CLICK, Hand.LEFT), GestureAction(Gesture.RIGHT_CLICK, Hand.LEFT)]
+
+
+def test_movement_hand_does_not_touch_left_hold():
+    state = GestureState()
+    actions = run(state, [(OPEN, make_hand(pinch=True))] * 5)
+    assert gestures(actions) == [Gesture.LEFT_HOLD_START]
+
+
+def test_scroll_follows_vertical_motion():
+    state = GestureState()
+    frames = [(make_hand(ring=DOWN, little=DOWN, dy=-0.02 * i), None) for i in range(10)]
+    actions = run(state, frames)
+    assert actions and all(a.gesture == Gesture.SCROLL and a.value > 0 for a in actions)
+    assert not run(state, [(make_hand(ring=DOWN, little=DOWN), None)] * 5, t0=1.0)  # hand held still
+
+
+def zoom_hand(spread):
+    return make_hand(middle=DOWN, ring=DOWN, little=UP, spread=spread)
+
+
+def click_hand(spread):
+    return make_hand(middle=DOWN, ring=DOWN, little=DOWN, spread=spread)
+
+
+def test_zoom_pose_zooms_and_never_clicks():
+    state = GestureState()
+    spreads = list(np.linspace(0.2, 0.0, 21)) + list(np.linspace(0.0, 0.2, 21))
+    actions = run(state, [(None, zoom_hand(s)) for s in spreads])
+    assert set(gestures(actions)) == {Gesture.ZOOM}
+    values = [a.value for a in actions]
+    assert values[0] < 0 and values[-1] > 0
+
+
+def test_plain_click_does_not_zoom():
+    state = GestureState()
+    spreads = list(np.linspace(0.16, 0.02, 8)) + [0.0] * 10 + list(np.linspace(0.02, 0.16, 8))
+    actions = run(state, [(None, click_hand(s)) for s in spreads])
+    assert gestures(actions) == [Gesture.LEFT_HOLD_START, Gesture.LEFT_HOLD_END]
+
+
+def test_hold_survives_raising_little_finger_without_zoom():
+    state = GestureState()
+    actions = run(state, [(None, click_hand(0.0))] + [(None, zoom_hand(0.0))] * 3
+                  + [(None, zoom_hand(s)) for s in np.linspace(0.0, 0.04, 5)])
+    assert gestures(actions) == [Gesture.LEFT_HOLD_START]
+
+
+def test_motion_gestures_disabled():
+    state = GestureState()
+    frames = [(make_hand(ring=DOWN, little=DOWN, dy=-0.02 * i), None) for i in range(10)]
+    for i, (right, left) in enumerate(frames):
+        assert state.update(right, left, i * DT, motion_gestures=False) == []
+    assert len(state.histories['right']) == 0
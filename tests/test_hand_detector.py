@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from detection.hand_detector import (HandDetector, HandLandmarks, Landmark, DetectionResult, NUM_LANDMARKS,
+                                     create_detector, assign_hands, draw_hands)
+
+
+def hand_at(x, label=None):
+    return HandLandmarks(tuple(Landmark(x, 0.5) for _ in range(NUM_LANDMARKS)), label)
+
+
+def test_base_detector_is_abstract():
+    with pytest.raises(TypeError):
+        HandDetector()
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        create_detector("nope")
+
+
+def test_stub_result_shape():
+    detector = create_detector("stub", num_hands=2)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    result = detector.detect(frame, 1234)
+    assert isinstance(result, DetectionResult)
+    assert result.timestamp_ms == 1234
+    assert result.latency_s >= 0
+    assert len(result.hands) == 2
+    assert [hand.label for hand in result.hands] == ['Left', 'Right']
+    for hand in result.hands:
+        assert len(hand.landmark) == NUM_LANDMARKS
+        assert all(0.0 <= p.x <= 1.0 and 0.0 <= p.y <= 1.0 for p in hand.landmark)
+
+
+def test_stub_pinches_second_half_of_period():
+    detector = create_detector("stub", pinch_period=4)
+    results = [detector.detect(None, t) for t in range(4)]
+    pinched = [r.hands[0].landmark[8] == r.hands[0].landmark[4] for r in results]
+    assert pinched == [False, False, True, True]
+
+
+def test_assign_hands_uses_mirrored_labels():
+    right, left = hand_at(0.2, 'Left'), hand_at(0.8, 'Right')
+    assert assign_hands((left, right)) == (right, left)
+    assert assign_hands((left, right), invert=True) == (left, right)
+    assert assign_hands((left,)) == (None, left)
+
+
+def test_assign_hands_falls_back_to_wrist_position():
+    a, b = hand_at(0.3), hand_at(0.7)
+    assert assign_hands((a, b)) == (b, a)
+    assert assign_hands((b, a)) == (b, a)
+    assert assign_hands((a,)) == (a, None)
+    assert assign_hands(()) == (None, None)
+
+
+def test_draw_hands_marks_landmarks():
+    detector = create_detector("stub")
+    result = detector.detect(None, 0)
+    img = np.zeros((240, 320, 3), dtype=np.uint8)
+    draw_hands(img, result.hands)
+    wrist = result.hands[0].landmark[0]
+    x, y = int(wrist.x * 320), int(wrist.y * 240)
+    assert tuple(img[y, x]) == (0, 0, 255)
+    assert img[..., 1].any()  # connections drawn in green
+    untouched = np.zeros_like(img)
+    draw_hands(untouched, ())
+    assert not untouched.any()
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from detection.hand_detector import HandLandmarks, Landmark, NUM_LANDMARKS
+from utils.landmark_history import LandmarkHistory, THUMB_TIP, INDEX_TIP, MIDDLE_MCP
+
+
+def make_hand(spread, x=0.5):
+    """Hand with a palm length of 0.2 and thumb-index distance `spread`."""
+    points = [Landmark(x, 0.5) for _ in range(NUM_LANDMARKS)]
+    points[MIDDLE_MCP] = Landmark(x, 0.3)
+    points[THUMB_TIP] = Landmark(x, 0.4)
+    points[INDEX_TIP] = Landmark(x + spread, 0.4)
+    return HandLandmarks(tuple(points))
+
+
+def window(history):
+    """(t, pinch) of the samples in the buffer, oldest first."""
+    slots = [history._slot(back) for back in reversed(range(len(history)))]
+    return history.timestamps[slots], history.pinch[slots]
+
+
+def test_pinch_trend_matches_polyfit_after_many_wraps():
+    rng = np.random.default_rng(0)
+    history = LandmarkHistory(capacity=16)
+    t = 1000.0
+    for i in range(16 * 50 + 7):
+        t += 0.03 + 0.01 * rng.random()
+        history.push(make_hand(0.05 + 0.02 * np.sin(i * 0.3) + 0.005 * rng.random()), t)
+        if i >= 2:
+            ts, ps = window(history)
+            assert history.pinch_trend == pytest.approx(np.polyfit(ts, ps, 1)[0], rel=1e-6, abs=1e-9)
+
+
+def test_oldest_sample_is_evicted():
+    history = LandmarkHistory(capacity=4)
+    for i in range(6):
+        history.push(make_hand(0.02 * (i + 1)), 0.1 * i)
+    assert len(history) == 4
+    ts, ps = window(history)
+    assert ts.tolist() == pytest.approx([0.2, 0.3, 0.4, 0.5])
+    assert ps.tolist() == pytest.approx([0.3, 0.4, 0.5, 0.6])
+    # Linear in time: 0.02 / 0.2 palm lengths per 0.1 s
+    assert history.pinch_trend == pytest.approx(1.0)
+
+
+def test_rebase_moves_origin_and_keeps_sums():
+    history = LandmarkHistory(capacity=4)
+    for i in range(8):
+        history.push(make_hand(0.02 * (i % 3)), 5.0 + 0.1 * i)
+    # Buffer just wrapped, so the origin was moved to the oldest sample
+    assert history.index == 0
+    assert history._origin == pytest.approx(5.4)
+    t = history.timestamps - history._origin
+    assert history._sum_t == pytest.approx(t.sum())
+    assert history._sum_tt == pytest.approx((t * t).sum())
+    assert history._sum_tp == pytest.approx((t * history.pinch).sum())
+    assert history._sum_p == pytest.approx(history.pinch.sum())
+
+
+@pytest.mark.parametrize("next_time", [1.0, 0.9, 1.0 + 0.5])
+def test_resets_on_gap_or_out_of_order_timestamp(next_time):
+    history = LandmarkHistory(capacity=8, max_gap=0.25)
+    for i in range(5):
+        history.push(make_hand(0.02 * i, x=0.1 * i), 0.6 + 0.1 * i)
+    assert len(history) == 5
+    history.push(make_hand(0.0), next_time)
+    assert len(history) == 1
+    assert history.dt == 0.0
+    assert history.pinch_trend == 0.0
+    assert not history.velocity.any()
+
+
+def test_velocity_follows_motion():
+    history = LandmarkHistory(capacity=8, ema_alpha=1.0)
+    for i in range(4):
+        history.push(make_hand(0.05, x=0.1 + 0.01 * i), 0.1 * i)
+    vx, vy = history.mean_velocity((THUMB_TIP, INDEX_TIP))
+    assert vx == pytest.approx(0.1)
+    assert vy == pytest.approx(0.0)
+
+
+def test_memory_is_bounded():
+    history = LandmarkHistory(capacity=32)
+    history.push(make_hand(0.05), 0.0)
+    size = history.nbytes
+    for i in range(1, 5000):
+        history.push(make_hand(0.05), 0.03 * i)
+    assert history.nbytes == size
+    assert len(history) == 32
+    assert history._origin >= 0.03 * (5000 - 64)
+
+
+def test_periodic_full_resum_matches_shift(monkeypatch):
+    shifted, resummed = LandmarkHistory(capacity=4), LandmarkHistory(capacity=4)
+    monkeypatch.setattr("utils.landmark_history.RESUM_WRAPS", 3)
+    for i in range(4 * 7):
+        hand = make_hand(0.02 * (i % 5))
+        resummed.push(hand, 2.0 + 0.1 * i)
+    monkeypatch.setattr("utils.landmark_history.RESUM_WRAPS", 10 ** 9)
+    for i in range(4 * 7):
+        shifted.push(make_hand(0.02 * (i % 5)), 2.0 + 0.1 * i)
+    assert shifted._origin == pytest.approx(resummed._origin)
+    for name in ("_sum_t", "_sum_p", "_sum_tt", "_sum_tp"):
+        assert getattr(shifted, name) == pytest.approx(getattr(resummed, name), abs=1e-9)
@@ -0,0 +1,150 @@
+import time
+import threading
+
+import numpy as np
+
+from config import Config
+from detection.stub_detector import StubHandDetector
+from streams.multi_stream import MultiStreamServer
+
+
+class Source:
+    def read(self):
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def release(self):
+        pass
+
+
+class RecordingDetector(StubHandDetector):
+    def __init__(self):
+        super().__init__()
+        self.timestamps = []
+
+    def detect(self, image_rgb, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        return super().detect(image_rgb, timestamp_ms)
+
+
+def test_timestamps_use_capture_time():
+    server = MultiStreamServer([Source()], workers=1, backend="stub")
+    stream = server.streams[0]
+    stream.detector = detector = RecordingDetector()
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    captured = [stream.origin + 0.1, stream.origin + 0.2]
+    for t in captured:
+        time.sleep(0.05)  # picked up late: pickup time must not leak into the timestamp
+        server._process(stream, frame, t)
+    assert [abs(ms - expected) <= 1 for ms, expected in zip(detector.timestamps, (100, 200))] == [True, True]
+    assert stream.state.hand_detected
+
+
+def test_stream_runs_gesture_state(monkeypatch):
+    monkeypatch.setattr(Config, "INVERT_HANDS", False)
+    server = MultiStreamServer([Source()], workers=1, backend="stub")
+    stream = server.streams[0]
+    stream.detector = StubHandDetector(pinch_period=4)
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for i in range(4):
+        server._process(stream, frame, stream.origin + i / 30)
+    assert stream.state.moving
+    assert stream.processed == 4
+
+
+def test_each_stream_gets_its_own_tracking_detector():
+    server = MultiStreamServer([Source(), Source(), Source()], workers=2, backend="stub").start()
+    try:
+        detectors = [s.detector for s in server.streams]
+        assert len(set(map(id, detectors))) == 3
+        deadline = time.time() + 2.0
+        while time.time() < deadline and not all(s.processed for s in server.streams):
+            time.sleep(0.01)
+        assert all(s.processed for s in server.streams)
+    finally:
+        server.stop()
+    assert all(s.detector is None for s in server.streams)
+
+
+def test_next_job_serves_least_recently_served_ready_stream():
+    server = MultiStreamServer([Source(), Source(), Source()], workers=1, backend="stub")
+    server._running = True
+    first, second, third = server.streams
+    for stream, served in ((first, 3.0), (second, 1.0), (third, 2.0)):
+        stream.pending = ("frame", 0.0, 1)
+        stream.last_served = served
+    stream, job = server._next_job()
+    assert stream is second and job == ("frame", 0.0, 1)
+    assert second.busy and second.pending is None and second.last_served > 3.0
+    assert server._next_job()[0] is third
+    assert server._next_job()[0] is first
+
+
+def test_next_job_never_returns_a_busy_stream():
+    server = MultiStreamServer([Source(), Source()], workers=2, backend="stub")
+    server._running = True
+    busy, idle = server.streams
+    busy.busy = True
+    busy.pending = ("newer", 0.0, 2)
+    idle.pending = ("frame", 0.0, 1)
+    idle.last_served = 5.0
+    assert server._next_job()[0] is idle
+
+    picked = []
+    worker = threading.Thread(target=lambda: picked.append(server._next_job()[0]))
+    worker.start()
+    worker.join(0.1)
+    assert worker.is_alive()  # only busy streams have work: wait
+    with server._cond:
+        busy.busy = False
+        server._cond.notify()
+    worker.join(1.0)
+    assert picked == [busy]
+
+
+def overload(server, costs, input_fps=30.0, latency=0.01):
+    for stream, cost in zip(server.streams, costs):
+        stream.input_fps_meter.smoothed_fps = input_fps
+        stream.cost_ema = cost
+        stream.latencies.clear()
+        stream.latencies.append(latency)
+
+
+def test_rebalance_sheds_most_expensive_after_two_overloaded_intervals():
+    server = MultiStreamServer([Source(), Source(), Source()], workers=1, backend="stub")
+    overload(server, (0.01, 0.02, 0.005))  # load 1.05
+    server.rebalance()
+    assert [s.shed_level for s in server.streams] == [0, 0, 0]
+    server.rebalance()
+    assert [s.shed_level for s in server.streams] == [0, 1, 0]
+    assert server.load > 0.9
+
+
+def test_rebalance_restores_cheapest_shed_stream_after_five_quiet_intervals():
+    server = MultiStreamServer([Source(), Source(), Source()], workers=1, backend="stub")
+    overload(server, (0.002, 0.004, 0.001))  # load 0.21 at full rate
+    for stream, level in zip(server.streams, (1, 2, 0)):
+        stream.shed_level = level
+    for _ in range(4):
+        server.rebalance()
+    assert [s.shed_level for s in server.streams] == [1, 2, 0]
+    server.rebalance()  # the cheapest shed stream, not the most shed one
+    assert [s.shed_level for s in server.streams] == [0, 2, 0]
+
+
+def test_rebalance_hysteresis_resets_between_thresholds():
+    server = MultiStreamServer([Source()], workers=1, backend="stub")
+    stream = server.streams[0]
+    overload(server, (0.04,))  # load 1.2
+    server.rebalance()
+    overload(server, (0.025,))  # load 0.75: neither over nor under
+    server.rebalance()
+    overload(server, (0.04,))
+    server.rebalance()
+    assert stream.shed_level == 0
+    server.rebalance()
+    assert stream.shed_level == 1
+    # Latency alone counts as overload
+    overload(server, (0.001,), latency=0.2)
+    server.rebalance()
+    server.rebalance()
+    assert stream.shed_level == 2
@@ -0,0 +1,60 @@
+from utils.perf_governor import PerformanceGovernor, DEFAULT_START_LEVEL
+
+
+def make_governor(**kwargs):
+    # Evaluate on every update() and ignore CPU so only latency drives decisions
+    defaults = dict(eval_interval=0, min_dwell=0, up_after=1, down_after=1, cpu_high=2.0, cpu_low=2.0)
+    defaults.update(kwargs)
+    return PerformanceGovernor(**defaults)
+
+
+def run(governor, latency_s, frames):
+    for _ in range(frames):
+        governor.record({"inference": latency_s})
+        governor.update()
+
+
+def test_steps_down_when_over_budget():
+    g = make_governor(target_latency_ms=40)
+    run(g, 0.2, 2)
+    assert g.level == DEFAULT_START_LEVEL - 2
+    assert len(g.decisions) == 2
+
+
+def test_does_not_climb_to_level_identical_after_fps_clamp():
+    g = make_governor(max_fps=30)
+    run(g, 0.001, 5)
+    assert g.level == DEFAULT_START_LEVEL
+    assert g.current.fps == 30
+    assert not g.decisions
+
+
+def test_climbs_when_ceiling_allows():
+    g = make_governor(max_fps=60)
+    run(g, 0.001, 5)
+    assert g.current.fps == 60
+
+
+def test_reset_returns_to_start_level():
+    g = make_governor()
+    run(g, 0.2, 3)
+    decision = g.reset("governor disabled")
+    assert decision is not None and decision.new_level == DEFAULT_START_LEVEL
+    assert g.level == DEFAULT_START_LEVEL
+    assert g.reset() is None
+
+
+def test_skips_complexity_only_levels_when_complexity_is_fixed():
+    g = make_governor(fixed_complexity=1)
+    run(g, 0.2, 1)
+    # L2 differs from L3 only in model complexity, which this detector cannot change
+    assert g.level == DEFAULT_START_LEVEL - 2
+    assert g.current.model_complexity == 1
+    assert len(g.decisions) == 1
+
+
+def test_detectors_report_complexity_support():
+    from detection.stub_detector import StubHandDetector
+    from detection.hand_detector import HandDetector
+    assert StubHandDetector.supports_model_complexity
+    assert not HandDetector.supports_model_complexity
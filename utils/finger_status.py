@@ -0,0 +1,55 @@
+import math
+
+# Landmark indices (Mediapipe hand model)
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_MCP, INDEX_TIP = 5, 8
+MIDDLE_MCP, MIDDLE_TIP = 9, 12
+RING_MCP, RING_TIP = 13, 16
+LITTLE_MCP, LITTLE_TIP = 17, 20
+
+
+def is_finger_near_thumb(finger_tip, thumb_tip, threshold=0.05):
+    """
+    Check if finger tip is close to thumb tip using Euclidean distance
+    """
+    return math.hypot(finger_tip.x - thumb_tip.x, finger_tip.y - thumb_tip.y) < threshold
+
+
+def thumb_index_distance(lm):
+    """
+    Thumb-index tip distance in normalized image units (same scale as the
+    pinch threshold of is_finger_near_thumb)
+    """
+    return math.hypot(lm[INDEX_TIP].x - lm[THUMB_TIP].x, lm[INDEX_TIP].y - lm[THUMB_TIP].y)
+
+
+def compute_finger_status(lm):
+    """
+    Finger up/down and pinch flags for one hand's landmark list. Pure function
+    with no pyautogui dependency, shared by Controller and per-stream state.
+    Keys match the Controller attribute names.
+    """
+    status = {
+        "little_finger_down": lm[LITTLE_TIP].y > lm[LITTLE_MCP].y,
+        "little_finger_up": lm[LITTLE_TIP].y < lm[LITTLE_MCP].y,
+        "index_finger_down": lm[INDEX_TIP].y > lm[INDEX_MCP].y,
+        "index_finger_up": lm[INDEX_TIP].y < lm[INDEX_MCP].y,
+        "middle_finger_down": lm[MIDDLE_TIP].y > lm[MIDDLE_MCP].y,
+        "middle_finger_up": lm[MIDDLE_TIP].y < lm[MIDDLE_MCP].y,
+        "ring_finger_down": lm[RING_TIP].y > lm[RING_MCP].y,
+        "ring_finger_up": lm[RING_TIP].y < lm[RING_MCP].y,
+        "thumb_finger_down": lm[THUMB_TIP].y > lm[THUMB_IP].y,
+        "thumb_finger_up": lm[THUMB_TIP].y < lm[THUMB_IP].y,
+    }
+    status["all_fingers_down"] = (
+        status["index_finger_down"] and status["middle_finger_down"] and
+        status["ring_finger_down"] and status["little_finger_down"])
+    status["all_fingers_up"] = (
+        status["index_finger_up"] and status["middle_finger_up"] and
+        status["ring_finger_up"] and status["little_finger_up"])
+    thumb_tip = lm[THUMB_TIP]
+    status["index_finger_within_thumb_finger"] = is_finger_near_thumb(lm[INDEX_TIP], thumb_tip)
+    status["middle_finger_within_thumb_finger"] = is_finger_near_thumb(lm[MIDDLE_TIP], thumb_tip)
+    status["ring_finger_within_thumb_finger"] = is_finger_near_thumb(lm[RING_TIP], thumb_tip)
+    status["little_finger_within_thumb_finger"] = is_finger_near_thumb(lm[LITTLE_TIP], thumb_tip)
+    return status
@@ -0,0 +1,177 @@
+from typing import List, NamedTuple
+
+from config import Config
+from events.event_bus import Gesture, Hand
+from utils.finger_status import compute_finger_status, thumb_index_distance
+from utils.landmark_history import LandmarkHistory
+
+
+class GestureAction(NamedTuple):
+    """One recognized gesture transition. `value` is the step count for SCROLL/ZOOM."""
+    gesture: Gesture
+    hand: Hand
+    value: float = 0.0
+
+
+class GestureState:
+    """
+    Gesture state machine for one user (movement hand + click hand). Pure: no
+    pyautogui, so the desktop Controller and each server-mode stream run the
+    same instance type. update() takes one frame's hands and returns the
+    GestureActions it triggers; callers act on them (press buttons, publish).
+
+    - Movement hand: pinch starts MOVE; all fingers up with the thumb down
+      while pinched is FREEZE (MOVE stays active underneath); unpinching ends both.
+      Losing only the movement hand ends nothing; HAND_LOST closes everything.
+    - Click hand: index pinch holds the left button, middle pinch is a single
+      right click on its rising edge.
+    - Motion gestures (when enabled): scroll with the movement hand, zoom with
+      the click hand, both from the per-hand LandmarkHistory. The zoom pose
+      (middle and ring folded, little finger up) never starts a left hold, and
+      zoom never runs while the button is held, so a click cannot zoom.
+    """
+    def __init__(self, history_size: int = None):
+        size = int(history_size or getattr(Config, 'HISTORY_SIZE', 32))
+        self.histories = {'right': LandmarkHistory(size), 'left': LandmarkHistory(size)}
+        self.hand_detected = False
+        self.move_active = False
+        self.frozen = False
+        self.left_hold = False
+        self.right_pressed = False
+        self._scroll_accum = 0.0
+        self._zoom_accum = 0.0
+
+    @property
+    def moving(self) -> bool:
+        """True while the cursor should follow the movement hand."""
+        return self.move_active and not self.frozen
+
+    def _edge(self, actions, attr, value, on, off, hand):
+        if getattr(self, attr) != value:
+            setattr(self, attr, value)
+            actions.append(GestureAction(on if value else off, hand))
+
+    def _set_move_active(self, actions, active):
+        self._edge(actions, 'move_active', active, Gesture.MOVE_START, Gesture.MOVE_END, Hand.RIGHT)
+
+    def _set_frozen(self, actions, frozen):
+        self._edge(actions, 'frozen', frozen, Gesture.FREEZE_START, Gesture.FREEZE_END, Hand.RIGHT)
+
+    def _set_left_hold(self, actions, held):
+        self._edge(actions, 'left_hold', held, Gesture.LEFT_HOLD_START, Gesture.LEFT_HOLD_END, Hand.LEFT)
+
+    def release_left_hold(self) -> List[GestureAction]:
+        actions = []
+        self._set_left_hold(actions, False)
+        return actions
+
+    def reset_history(self, hand_key=None):
+        """Clear one hand's history ('right'/'left'), or all of them when hand_key is None."""
+        for key, history in self.histories.items():
+            if hand_key is None or key == hand_key:
+                history.reset()
+        if hand_key in (None, 'right'):
+            self._scroll_accum = 0.0
+        if hand_key in (None, 'left'):
+            self._zoom_accum = 0.0
+
+    def hand_lost(self) -> List[GestureAction]:
+        """Close every open gesture and report HAND_LOST (once per loss)."""
+        actions = []
+        if self.hand_detected:
+            self._set_move_active(actions, False)
+            self._set_frozen(actions, False)
+            self._set_left_hold(actions, False)
+            actions.append(GestureAction(Gesture.HAND_LOST, Hand.UNKNOWN))
+        self.hand_detected = False
+        self.right_pressed = False
+        self.reset_history()
+        return actions
+
+    def update(self, right_hand, left_hand, timestamp: float, motion_gestures: bool = True) -> List[GestureAction]:
+        """Advance on one frame; `timestamp` in seconds, increasing per frame."""
+        if right_hand is None and left_hand is None:
+            return self.hand_lost()
+        self.hand_detected = True
+        actions = []
+
+        if right_hand is not None:
+            st = compute_finger_status(right_hand.landmark)
+            if not st["index_finger_within_thumb_finger"]:
+                self._set_move_active(actions, False)
+                self._set_frozen(actions, False)
+            elif st["all_fingers_up"] and st["thumb_finger_down"]:
+                self._set_frozen(actions, True)
+            else:
+                self._set_frozen(actions, False)
+                self._set_move_active(actions, True)
+            if motion_gestures:
+                self.histories['right'].push(right_hand, timestamp)
+                self._scroll(actions, st)
+        elif motion_gestures:
+            self.reset_history('right')
+
+        if left_hand is not None:
+            st = compute_finger_status(left_hand.landmark)
+            zoom_pose = bool(st["middle_finger_down"] and st["ring_finger_down"] and st["little_finger_up"])
+            # A pinch presses the button only outside the zoom pose; a started hold lasts until the pinch opens
+            pinched = bool(st["index_finger_within_thumb_finger"])
+            self._set_left_hold(actions, pinched and (self.left_hold or not zoom_pose))
+            middle = bool(st["middle_finger_within_thumb_finger"])
+            if middle and not self.right_pressed:
+                actions.append(GestureAction(Gesture.RIGHT_CLICK, Hand.LEFT))
+            self.right_pressed = middle
+            if motion_gestures:
+                self.histories['left'].push(left_hand, timestamp)
+                self._zoom(actions, zoom_pose, left_hand)
+        else:
+            self._set_left_hold(actions, False)
+            if motion_gestures:
+                self.reset_history('left')
+        return actions
+
+    def _scroll(self, actions, st):
+        """
+        Continuous scroll: index and middle up, ring and little down, no index-thumb
+        pinch. Vertical fingertip velocity sets the rate; fractional steps accumulate.
+        """
+        history = self.histories['right']
+        scroll_pose = (st["index_finger_up"] and st["middle_finger_up"] and st["ring_finger_down"]
+                       and st["little_finger_down"] and not st["index_finger_within_thumb_finger"])
+        if not scroll_pose:
+            self._scroll_accum = 0.0
+            return
+        if len(history) < 2:
+            return
+        _, vy = history.mean_velocity((8, 12))
+        if abs(vy) < Config.SCROLL_DEADZONE:
+            return
+        # Hand moving up (negative y) scrolls up (positive clicks)
+        self._scroll_accum += -vy * Config.SCROLL_SPEED * history.dt
+        clicks = int(self._scroll_accum)
+        if clicks:
+            self._scroll_accum -= clicks
+            actions.append(GestureAction(Gesture.SCROLL, Hand.RIGHT, float(clicks)))
+
+    def _zoom(self, actions, zoom_pose, hand):
+        """
+        Continuous zoom: middle and ring folded, little finger up, while thumb and
+        index spread (zoom in) or close (zoom out). Paused while the left button is
+        held and below ZOOM_MIN_PINCH, where the thumb-index distance gets noisy.
+        """
+        history = self.histories['left']
+        if (not zoom_pose or self.left_hold
+                or thumb_index_distance(hand.landmark) < Config.ZOOM_MIN_PINCH):
+            # Drop the window so the trend only ever covers frames inside the zoom pose
+            self.reset_history('left')
+            return
+        if len(history) < 3:
+            return
+        trend = history.pinch_trend
+        if abs(trend) < Config.ZOOM_DEADZONE:
+            return
+        self._zoom_accum += trend * Config.ZOOM_SPEED * history.dt
+        steps = int(self._zoom_accum)
+        if steps:
+            self._zoom_accum -= steps
+            actions.append(GestureAction(Gesture.ZOOM, Hand.LEFT, float(steps)))
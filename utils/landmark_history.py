@@ -0,0 +1,170 @@
+import numpy as np
+
+THUMB_TIP = 4
+INDEX_TIP = 8
+WRIST = 0
+MIDDLE_MCP = 9
+
+# Recompute the regression sums from the buffer once every this many wraps
+RESUM_WRAPS = 1024
+
+
+class LandmarkHistory:
+    """
+    Fixed-size circular buffer of one hand's landmark history.
+
+    push() stores the frame in preallocated NumPy arrays and updates velocity,
+    acceleration and the pinch-distance trend incrementally, so each frame costs
+    the same regardless of window size and memory never grows.
+
+    - velocity / acceleration: EMA-smoothed, per landmark, normalized units per second
+    - pinch_trend: least-squares slope of the thumb-index distance over the window,
+      kept as running sums that are updated when a sample enters or is evicted
+    """
+    def __init__(self, capacity: int = 32, num_landmarks: int = 21, ema_alpha: float = 0.5,
+                 max_gap: float = 0.25):
+        self.capacity = max(2, int(capacity))
+        self.num_landmarks = num_landmarks
+        self.ema_alpha = max(0.0, min(ema_alpha, 1.0))
+        self.max_gap = max_gap
+        self.positions = np.zeros((self.capacity, num_landmarks, 2), dtype=np.float32)
+        self.timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self.pinch = np.zeros(self.capacity, dtype=np.float64)
+        self.velocity = np.zeros((num_landmarks, 2), dtype=np.float64)
+        self.acceleration = np.zeros((num_landmarks, 2), dtype=np.float64)
+        self.reset()
+
+    def reset(self):
+        """Forget all samples (e.g. when the hand is lost)."""
+        self.index = 0
+        self.count = 0
+        self.velocity.fill(0.0)
+        self.acceleration.fill(0.0)
+        self._origin = None
+        self._wraps = 0
+        self._sum_t = 0.0
+        self._sum_p = 0.0
+        self._sum_tt = 0.0
+        self._sum_tp = 0.0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return (self.positions.nbytes + self.timestamps.nbytes + self.pinch.nbytes
+                + self.velocity.nbytes + self.acceleration.nbytes)
+
+    def _slot(self, back: int) -> int:
+        """Buffer slot of the sample `back` frames ago (0 = latest)."""
+        return (self.index - 1 - back) % self.capacity
+
+    def latest(self):
+        """Latest (21, 2) positions, or None if empty."""
+        if self.count == 0:
+            return None
+        return self.positions[self._slot(0)]
+
+    @property
+    def dt(self) -> float:
+        """Seconds between the two latest samples (0 if fewer than two)."""
+        if self.count < 2:
+            return 0.0
+        return float(self.timestamps[self._slot(0)] - self.timestamps[self._slot(1)])
+
+    @property
+    def pinch_distance(self) -> float:
+        return float(self.pinch[self._slot(0)]) if self.count else 0.0
+
+    def push(self, hand, timestamp: float):
+        """Add one hand (anything with .landmark[i].x/.y) observed at `timestamp` seconds."""
+        if self.count and (timestamp <= self.timestamps[self._slot(0)]
+                           or timestamp - self.timestamps[self._slot(0)] > self.max_gap):
+            # Out of order or too long since the last frame: derivatives would be meaningless
+            self.reset()
+        if self._origin is None:
+            self._origin = timestamp
+
+        slot = self.index
+        pos = self.positions[slot]
+        lm = hand.landmark
+        for i in range(self.num_landmarks):
+            pos[i, 0] = lm[i].x
+            pos[i, 1] = lm[i].y
+
+        # Thumb-index distance normalized by palm length so it is independent of camera distance
+        palm = float(np.hypot(*(pos[MIDDLE_MCP] - pos[WRIST]))) or 1e-6
+        pinch = float(np.hypot(*(pos[INDEX_TIP] - pos[THUMB_TIP]))) / palm
+        t = timestamp - self._origin
+
+        if self.count == self.capacity:
+            # Evict the oldest sample from the running regression sums
+            old_t = self.timestamps[slot] - self._origin
+            old_p = self.pinch[slot]
+            self._sum_t -= old_t
+            self._sum_p -= old_p
+            self._sum_tt -= old_t * old_t
+            self._sum_tp -= old_t * old_p
+
+        if self.count:
+            prev = self._slot(0)
+            dt = timestamp - self.timestamps[prev]
+            inst_velocity = (pos - self.positions[prev]) / dt
+            prev_velocity = self.velocity.copy()
+            a = self.ema_alpha if self.count > 1 else 1.0
+            self.velocity *= (1.0 - a)
+            self.velocity += a * inst_velocity
+            if self.count > 1:
+                inst_accel = (self.velocity - prev_velocity) / dt
+                self.acceleration *= (1.0 - self.ema_alpha)
+                self.acceleration += self.ema_alpha * inst_accel
+
+        self.timestamps[slot] = timestamp
+        self.pinch[slot] = pinch
+        self._sum_t += t
+        self._sum_p += pinch
+        self._sum_tt += t * t
+        self._sum_tp += t * pinch
+
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        if self.index == 0 and self.count == self.capacity:
+            self._rebase()
+
+    def _rebase(self):
+        """
+        Move the time origin to the oldest sample (slot 0 right after a wrap) so the
+        running sums stay small in long sessions. Shifting every t by c updates the
+        sums in O(1); a full recompute clears rounding drift every RESUM_WRAPS wraps.
+        """
+        self._wraps += 1
+        if self._wraps % RESUM_WRAPS == 0:
+            self._origin = float(self.timestamps[0])
+            t = self.timestamps - self._origin
+            self._sum_t = float(t.sum())
+            self._sum_p = float(self.pinch.sum())
+            self._sum_tt = float((t * t).sum())
+            self._sum_tp = float((t * self.pinch).sum())
+            return
+        n = self.count
+        c = float(self.timestamps[0]) - self._origin
+        self._origin += c
+        self._sum_tp -= c * self._sum_p
+        self._sum_tt -= 2.0 * c * self._sum_t - n * c * c
+        self._sum_t -= n * c
+
+    @property
+    def pinch_trend(self) -> float:
+        """Slope of normalized pinch distance per second over the window (>0 = spreading)."""
+        n = self.count
+        if n < 3:
+            return 0.0
+        denom = n * self._sum_tt - self._sum_t * self._sum_t
+        if denom <= 1e-12:
+            return 0.0
+        return (n * self._sum_tp - self._sum_t * self._sum_p) / denom
+
+    def mean_velocity(self, indices):
+        """Mean (vx, vy) of the given landmarks."""
+        v = self.velocity[list(indices)].mean(axis=0)
+        return float(v[0]), float(v[1])
@@ -0,0 +1,217 @@
+import os
+import time
+from collections import deque
+from typing import NamedTuple, Optional, Dict
+
+try:
+    import psutil  # optional: host-wide CPU usage
+except ImportError:
+    psutil = None
+
+
+class GovernorLevel(NamedTuple):
+    width: int
+    height: int
+    fps: int
+    model_complexity: int
+
+    def describe(self) -> str:
+        return f"{self.width}x{self.height}@{self.fps} c{self.model_complexity}"
+
+
+# Ordered from cheapest to most expensive. The governor only ever moves one step at a time.
+DEFAULT_LEVELS = (
+    GovernorLevel(320, 240, 15, 0),
+    GovernorLevel(480, 360, 20, 0),
+    GovernorLevel(640, 480, 30, 0),
+    GovernorLevel(640, 480, 30, 1),
+    GovernorLevel(640, 480, 60, 1),
+)
+
+# Level matching the original fixed setup (640x480, default Hands complexity)
+DEFAULT_START_LEVEL = 3
+
+
+class GovernorDecision(NamedTuple):
+    timestamp: float
+    old_level: int
+    new_level: int
+    reason: str
+
+    def describe(self) -> str:
+        direction = "DOWN" if self.new_level < self.old_level else "UP"
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+        return f"[{stamp}] {direction} L{self.old_level}->L{self.new_level}: {self.reason}"
+
+
+class PerformanceGovernor:
+    """
+    Closed-loop governor that keeps per-frame processing latency near a target.
+    Call record() once per frame with per-stage latencies (seconds) and update()
+    afterwards; update() returns a GovernorDecision when the level changes.
+    Level FPS is clamped to `max_fps` (the TARGET_FPS ceiling), model complexity
+    is pinned when the detector cannot change it (`fixed_complexity`), and levels
+    that are identical after that are skipped, so every change has an effect.
+    Steps down quickly when over budget and up slowly when there is headroom
+    (asymmetric hysteresis), with a minimum dwell time between changes.
+    """
+    def __init__(self, target_latency_ms: float = 40.0, levels=DEFAULT_LEVELS,
+                 start_level: int = DEFAULT_START_LEVEL, eval_interval: float = 1.0,
+                 min_dwell: float = 3.0, down_after: int = 2, up_after: int = 5,
+                 upper_ratio: float = 1.15, lower_ratio: float = 0.6,
+                 cpu_high: float = 0.9, cpu_low: float = 0.7, history: int = 50,
+                 max_fps: Optional[float] = None, fixed_complexity: Optional[int] = None):
+        self.levels = tuple(levels)
+        self.start_level = max(0, min(start_level, len(self.levels) - 1))
+        self.level = self.start_level
+        self.max_fps = max_fps
+        self.fixed_complexity = fixed_complexity
+        self.target_latency_ms = float(target_latency_ms)
+        self.eval_interval = eval_interval
+        self.min_dwell = min_dwell
+        self.down_after = max(1, down_after)
+        self.up_after = max(1, up_after)
+        self.upper_ratio = upper_ratio
+        self.lower_ratio = lower_ratio
+        self.cpu_high = cpu_high
+        self.cpu_low = cpu_low
+        self.decisions = deque(maxlen=history)
+
+        self.stage_ms: Dict[str, float] = {}
+        self.latency_ms = 0.0
+        self.cpu = 0.0
+        self._samples = deque(maxlen=120)
+        self._over = 0
+        self._under = 0
+        self._last_change = time.time()
+        self._last_eval = time.time()
+        self._last_cpu_wall = time.time()
+        self._last_cpu_proc = time.process_time()
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)  # prime the counter
+
+    def effective(self, index: int) -> GovernorLevel:
+        """Level `index` as it can actually be applied: FPS clamped to max_fps, complexity pinned if fixed."""
+        level = self.levels[index]
+        if self.max_fps is not None and level.fps > self.max_fps:
+            level = level._replace(fps=int(self.max_fps))
+        if self.fixed_complexity is not None:
+            level = level._replace(model_complexity=self.fixed_complexity)
+        return level
+
+    @property
+    def current(self) -> GovernorLevel:
+        return self.effective(self.level)
+
+    def set_max_fps(self, fps: float):
+        self.max_fps = max(1.0, float(fps))
+
+    def set_fixed_complexity(self, model_complexity: Optional[int]):
+        """Pin model complexity (detector cannot change it), or None when it can."""
+        self.fixed_complexity = model_complexity
+
+    def _neighbour(self, step: int) -> int:
+        """Nearest level in direction `step` that differs from the current one after clamping."""
+        current = self.current
+        index = self.level + step
+        while 0 <= index < len(self.levels):
+            if self.effective(index) != current:
+                return index
+            index += step
+        return self.level
+
+    def reset(self, reason: str = "reset") -> Optional[GovernorDecision]:
+        """Return to the start level (e.g. when the governor is switched off)."""
+        self._over = 0
+        self._under = 0
+        self._samples.clear()
+        if self.level == self.start_level:
+            return None
+        return self._change(self.start_level, f"{reason} -> {self.effective(self.start_level).describe()}")
+
+    def _change(self, new_level: int, reason: str) -> GovernorDecision:
+        decision = GovernorDecision(time.time(), self.level, new_level, reason)
+        self.level = new_level
+        self._over = 0
+        self._under = 0
+        self._last_change = decision.timestamp
+        self.decisions.append(decision)
+        print(f"Governor: {decision.describe()}")
+        return decision
+
+    def set_target_latency(self, target_latency_ms: float):
+        self.target_latency_ms = max(1.0, float(target_latency_ms))
+
+    def record(self, stage_times: Dict[str, float]):
+        """Record one frame's per-stage latencies in seconds."""
+        for stage, seconds in stage_times.items():
+            ms = seconds * 1000.0
+            prev = self.stage_ms.get(stage)
+            self.stage_ms[stage] = ms if prev is None else 0.8 * prev + 0.2 * ms
+        self._samples.append(sum(stage_times.values()) * 1000.0)
+
+    def _sample_cpu(self, now: float) -> float:
+        if psutil is not None:
+            return psutil.cpu_percent(interval=None) / 100.0
+        wall = now - self._last_cpu_wall
+        proc = time.process_time()
+        used = proc - self._last_cpu_proc
+        self._last_cpu_wall = now
+        self._last_cpu_proc = proc
+        if wall <= 0:
+            return self.cpu
+        return min(1.0, used / (wall * (os.cpu_count() or 1)))
+
+    def update(self) -> Optional[GovernorDecision]:
+        """Evaluate the recorded window; return a decision when the level changes."""
+        now = time.time()
+        if now - self._last_eval < self.eval_interval or not self._samples:
+            return None
+        self._last_eval = now
+
+        # 90th percentile of the window so a few slow frames count, single spikes do not
+        window = sorted(self._samples)
+        self._samples.clear()
+        self.latency_ms = window[int(0.9 * (len(window) - 1))]
+        self.cpu = self._sample_cpu(now)
+
+        target = self.target_latency_ms
+        if self.latency_ms > target * self.upper_ratio or self.cpu > self.cpu_high:
+            self._over += 1
+            self._under = 0
+        elif self.latency_ms < target * self.lower_ratio and self.cpu < self.cpu_low:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if now - self._last_change < self.min_dwell:
+            return None
+
+        new_level = self.level
+        if self._over >= self.down_after:
+            new_level = self._neighbour(-1)
+        elif self._under >= self.up_after:
+            new_level = self._neighbour(1)
+        if new_level == self.level:
+            return None
+
+        reason = (f"p90 latency {self.latency_ms:.1f}ms vs target {target:.0f}ms, "
+                  f"cpu {self.cpu * 100:.0f}% -> {self.effective(new_level).describe()}")
+        return self._change(new_level, reason)
+
+    def summary(self) -> str:
+        """One-line status for overlays and UIs."""
+        return (f"L{self.level} {self.current.describe()} | "
+                f"{self.latency_ms:.0f}/{self.target_latency_ms:.0f}ms | cpu {self.cpu * 100:.0f}%")
+
+    def status_text(self) -> str:
+        """Multi-line status including per-stage latencies and recent decisions."""
+        lines = [f"Governor: {self.summary()}"]
+        if self.stage_ms:
+            lines.append("Stages: " + ", ".join(f"{k}={v:.1f}ms" for k, v in self.stage_ms.items()))
+        if self.decisions:
+            lines.append("Recent decisions:")
+            lines.extend(d.describe() for d in list(self.decisions)[-10:])
+        return "\n".join(lines)
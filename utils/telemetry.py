@@ -0,0 +1,31 @@
+import time
+from types import MappingProxyType
+
+
+class Telemetry:
+    """
+    Lock-free snapshot store between the frame loop (single writer) and any
+    number of readers on other threads. publish() builds a new read-only mapping
+    and swaps the reference, which is atomic in CPython, so readers never see a
+    half-written snapshot and the frame loop never waits on a reader.
+    """
+    def __init__(self):
+        self._snapshot = MappingProxyType({"seq": 0, "time": time.time()})
+        self._seq = 0
+
+    def publish(self, data: dict):
+        self._seq += 1
+        data["seq"] = self._seq
+        data["time"] = time.time()
+        self._snapshot = MappingProxyType(data)
+
+    def read(self):
+        """Latest snapshot (read-only mapping); `seq` increases with every publish."""
+        return self._snapshot
+
+    def clear(self):
+        self.publish({})
+
+
+# Process-wide instance written by HandTrackingApp.run()
+telemetry = Telemetry()
@@ -1,16 +1,17 @@
 import cv2
 import time
-from typing import Tuple, Any
+from typing import Tuple, Any, Union
 
 class CaptureManager:
     """
     Thin wrapper over cv2.VideoCapture that enforces an approximate target FPS
     by pacing reads with sleep. Use set_target_fps to adjust at runtime.
+    `device_index` may also be a device path or video file.
     """
-    def __init__(self, device_index: int = 0, width: int = 640, height: int = 480, target_fps: float = 30.0):
+    def __init__(self, device_index: Union[int, str] = 0, width: int = 640, height: int = 480, target_fps: float = 30.0):
         self.cap = cv2.VideoCapture(device_index)
         if not self.cap.isOpened():
-            raise Exception("Error: Could not open camera")
+            raise Exception(f"Error: Could not open camera {device_index}")
         # Try to set properties (not all cams honor these)
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
@@ -18,14 +19,33 @@ class CaptureManager:
         self._target_fps = max(1.0, float(target_fps))
         self._min_interval = 1.0 / self._target_fps
         self._last_return_time = 0.0
+        self._resolution = (int(width), int(height))
+
+    @property
+    def target_fps(self) -> float:
+        return self._target_fps
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        return self._resolution
 
     def set_target_fps(self, fps: float):
         fps = max(1.0, float(fps))
+        if fps == self._target_fps:
+            return
         self._target_fps = fps
         self._min_interval = 1.0 / fps
         # also hint camera driver
         self.cap.set(cv2.CAP_PROP_FPS, fps)
 
+    def set_resolution(self, width: int, height: int):
+        """Request a new capture resolution; no-op if unchanged."""
+        if (int(width), int(height)) == self._resolution:
+            return
+        self._resolution = (int(width), int(height))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
     def read(self) -> Tuple[bool, Any]:
         # Pace reads to not exceed target FPS
         now = time.time()